@@ -0,0 +1,113 @@
+"""In-memory audio decoding helpers."""
+
+import io
+import logging
+import shutil
+import subprocess
+import tempfile
+from typing import BinaryIO
+
+import numpy as np
+import soundfile as sf
+import soxr
+
+logger = logging.getLogger(__name__)
+
+# Client-facing decode error; details (which can include object reprs) are only logged
+UNSUPPORTED_FORMAT = "Unsupported audio format"
+
+# whisper.cpp only accepts 16 kHz mono float32 PCM
+WHISPER_SAMPLE_RATE = 16000
+
+
+def decode_audio(content: bytes | BinaryIO) -> tuple[np.ndarray, int]:
+    """Decode an encoded audio file held in memory.
+
+    soundfile handles WAV/FLAC/OGG/MP3 in process; anything else (browser webm/opus,
+    m4a/aac, mp4, ...) falls back to ffmpeg as pywhispercpp's file loader did.
+
+    Args:
+        content: Raw bytes of the audio file, or a seekable file object to decode
+            in place (e.g. an UploadFile's spooled file) without copying it to bytes
+
+    Returns:
+        Tuple of (float32 samples, sample rate)
+
+    Raises:
+        ValueError: If the audio format cannot be decoded
+    """
+    source = io.BytesIO(content) if isinstance(content, bytes) else content
+    try:
+        data, sample_rate = sf.read(source, dtype="float32", always_2d=False)
+    except sf.SoundFileError as e:
+        if shutil.which("ffmpeg") is None:
+            logger.warning(f"soundfile could not decode upload: {e}")
+            raise ValueError(UNSUPPORTED_FORMAT)
+        return _decode_with_ffmpeg(source), WHISPER_SAMPLE_RATE
+    return data, sample_rate
+
+
+def decode_to_whisper_pcm(content: bytes | BinaryIO) -> np.ndarray:
+    """Decode an audio file and convert it to 16 kHz mono float32 in one blocking call.
+
+    Meant to run in a worker thread: besides the decode, downmixing and resampling a long
+    upload is too slow for the event loop.
+
+    Raises:
+        ValueError: If the audio format cannot be decoded
+    """
+    samples, sample_rate = decode_audio(content)
+    return to_whisper_pcm(samples, sample_rate)
+
+
+def _decode_with_ffmpeg(source: BinaryIO) -> np.ndarray:
+    """Decode any format ffmpeg understands to 16 kHz mono float32 samples.
+
+    Raises:
+        ValueError: If ffmpeg cannot decode the audio
+    """
+    source.seek(0)
+    # A real file lets ffmpeg seek, which MP4/M4A needs when the index sits at the end
+    with tempfile.NamedTemporaryFile() as tmp:
+        shutil.copyfileobj(source, tmp)
+        tmp.flush()
+        result = subprocess.run(
+            [
+                "ffmpeg",
+                "-nostdin",
+                "-hide_banner",
+                "-loglevel",
+                "error",
+                "-i",
+                tmp.name,
+                "-f",
+                "f32le",
+                "-ac",
+                "1",
+                "-ar",
+                str(WHISPER_SAMPLE_RATE),
+                "pipe:1",
+            ],
+            capture_output=True,
+        )
+    if result.returncode != 0:
+        logger.warning(f"ffmpeg could not decode upload: {result.stderr.decode(errors='replace').strip()}")
+        raise ValueError(UNSUPPORTED_FORMAT)
+    return np.frombuffer(result.stdout, dtype=np.float32)
+
+
+def to_whisper_pcm(audio: np.ndarray, sample_rate: int) -> np.ndarray:
+    """Convert PCM samples to the 16 kHz mono float32 layout whisper.cpp expects.
+
+    Args:
+        audio: Samples shaped (frames,) or (frames, channels)
+        sample_rate: Sample rate of the input audio in Hz
+
+    Returns:
+        Contiguous mono float32 array at 16 kHz
+    """
+    if audio.ndim > 1:
+        audio = audio.mean(axis=1)
+    if sample_rate != WHISPER_SAMPLE_RATE:
+        audio = soxr.resample(audio, sample_rate, WHISPER_SAMPLE_RATE)
+    return np.ascontiguousarray(audio, dtype=np.float32)
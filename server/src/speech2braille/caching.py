@@ -0,0 +1,26 @@
+"""HTTP conditional-request (ETag) helpers."""
+
+import hashlib
+
+from fastapi import Request, Response
+
+
+def make_etag(*parts: object) -> str:
+    """Build a strong ETag from the values a response is derived from."""
+    digest = hashlib.md5("\0".join(map(str, parts)).encode(), usedforsecurity=False).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Check whether the request's If-None-Match header already names this ETag."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return etag in (tag.strip().removeprefix("W/") for tag in header.split(","))
+
+
+def not_modified(etag: str) -> Response:
+    """Build an empty 304 response for a client whose cached copy is current."""
+    return Response(status_code=304, headers={"ETag": etag})
@@ -1,5 +1,7 @@
 """Configuration management using Pydantic Settings."""
 
+from functools import cached_property
+
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -11,8 +13,25 @@ class ASRConfig(BaseSettings):
 
     model_name: str = Field(default="base", description="Whisper model name (tiny, base, small, medium, large-v3)")
     model_path: str | None = Field(default=None, description="Optional path to local GGML model file")
-    n_threads: int = Field(default=4, description="Number of threads for inference")
+    quantization: str | None = Field(
+        default="q8_0",
+        description="Preferred GGML quantization for named models (q8_0, q5_1, q5_0); None loads full precision",
+    )
+    n_threads: int | None = Field(
+        default=None,
+        ge=1,
+        description="Number of threads for inference (defaults to the CPUs available to this process)",
+    )
     default_language: str = Field(default="en", description="Default language for transcription (required)")
+    warmup: bool = Field(default=True, description="Run one silent inference at load so the first request isn't slow")
+    n_processors: int = Field(
+        default=1,
+        ge=1,
+        description="Split long uploads into this many chunks decoded in parallel (sharing the n_threads budget)",
+    )
+    parallel_min_chunk_s: float = Field(
+        default=30.0, gt=0, description="Minimum audio seconds per chunk before parallel decoding is used"
+    )
 
     # Non-speech suppression
     # Note: suppress_non_speech_tokens is not exposed in pywhispercpp C bindings (v1.4.1)
@@ -42,6 +61,25 @@ class WebSocketConfig(BaseSettings):
     context_window_seconds: float = Field(default=1.0, description="Seconds of audio to overlap for context")
     use_context_carryover: bool = Field(default=True, description="Use previous transcription as prompt for context")
 
+    partial_interval: float = Field(
+        default=0.0,
+        ge=0.0,
+        description="Seconds of new audio between partial hypotheses while a window fills (0 disables)",
+    )
+
+    send_processing: bool = Field(
+        default=True, description="Send a 'processing' message before each window's result (one extra frame per window)"
+    )
+
+    inference_queue_size: int = Field(
+        default=2, ge=1, description="Audio windows that may wait for transcription before the oldest is dropped"
+    )
+
+    use_scratch_files: bool = Field(
+        default=False,
+        description="Hand chunks to the ASR backend as pooled scratch WAV files instead of in-memory PCM",
+    )
+
 
 class BrailleConfig(BaseSettings):
     """Braille translation configuration."""
@@ -49,14 +87,17 @@ class BrailleConfig(BaseSettings):
     model_config = SettingsConfigDict(env_prefix="S2B_BRAILLE_")
 
     default_table: str = Field(default="en-ueb-g2.ctb", description="Default braille table")
-    table_directories: list[str] = Field(
-        default=[
+    table_directories: tuple[str, ...] = Field(
+        default=(
             "/usr/share/liblouis/tables",
             "/usr/local/share/liblouis/tables",
             "/opt/homebrew/share/liblouis/tables",
-        ],
+        ),
         description="Directories to search for braille tables",
     )
+    translation_cache_size: int = Field(
+        default=4096, ge=0, description="Number of (text, table) translations to memoize (0 disables)"
+    )
 
 
 class VADConfig(BaseSettings):
@@ -66,6 +107,9 @@ class VADConfig(BaseSettings):
 
     enabled: bool = Field(default=True, description="Enable VAD")
     library: str = Field(default="silero", description="VAD library: silero, webrtc")
+    onnx: bool = Field(
+        default=True, description="Run Silero VAD on ONNX Runtime (falls back to PyTorch if unavailable)"
+    )
     threshold: float = Field(default=0.5, description="Speech probability threshold (0.0-1.0)")
     min_speech_duration_ms: int = Field(default=250, description="Minimum speech duration (ms)")
     min_silence_duration_ms: int = Field(default=800, description="Silence duration to mark speech end (ms)")
@@ -81,10 +125,15 @@ class CORSConfig(BaseSettings):
 
     model_config = SettingsConfigDict(env_prefix="S2B_CORS_")
 
-    allow_origins: list[str] = Field(default=["*"], description="Allowed CORS origins")
+    allow_origins: tuple[str, ...] = Field(default=("*",), description="Allowed CORS origins")
     allow_credentials: bool = Field(default=True, description="Allow credentials")
-    allow_methods: list[str] = Field(default=["*"], description="Allowed HTTP methods")
-    allow_headers: list[str] = Field(default=["*"], description="Allowed HTTP headers")
+    allow_methods: tuple[str, ...] = Field(default=("*",), description="Allowed HTTP methods")
+    allow_headers: tuple[str, ...] = Field(default=("*",), description="Allowed HTTP headers")
+
+    @cached_property
+    def allow_origins_set(self) -> frozenset[str]:
+        """Allowed origins as a set for O(1) per-request membership checks."""
+        return frozenset(self.allow_origins)
 
 
 class Settings(BaseSettings):
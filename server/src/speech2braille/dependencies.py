@@ -3,7 +3,7 @@
 from functools import lru_cache
 from typing import Annotated
 
-from fastapi import Depends
+from fastapi import Depends, Request
 
 from speech2braille.config import Settings
 from speech2braille.services.asr_service import ASRService
@@ -18,30 +18,28 @@ def get_settings() -> Settings:
     return Settings()
 
 
-def get_asr_service(settings: Annotated[Settings, Depends(get_settings)]) -> ASRService:
+def get_asr_service(request: Request) -> ASRService:
     """Get the ASR service instance.
 
-    Note: The actual singleton is managed by the application lifespan.
-    This dependency retrieves it from app.state.
+    The singleton is created once in create_app and stored on app.state by the
+    application lifespan, so no per-request construction happens here.
     """
-    # This will be overridden in main.py to use app.state
-    # For now, create a new instance (will be replaced at runtime)
-    return ASRService(settings.asr)
+    return request.app.state.asr_service
 
 
-def get_braille_service(settings: Annotated[Settings, Depends(get_settings)]) -> BrailleService:
+def get_braille_service(request: Request) -> BrailleService:
     """Get the braille service instance."""
-    return BrailleService(settings.braille)
+    return request.app.state.braille_service
 
 
-def get_table_service(settings: Annotated[Settings, Depends(get_settings)]) -> TableService:
+def get_table_service(request: Request) -> TableService:
     """Get the table service instance."""
-    return TableService(settings.braille)
+    return request.app.state.table_service
 
 
-def get_vad_service(settings: Annotated[Settings, Depends(get_settings)]) -> VADService:
+def get_vad_service(request: Request) -> VADService:
     """Get the VAD service instance."""
-    return VADService(settings.vad)
+    return request.app.state.vad_service
 
 
 # Type aliases for use in route dependencies
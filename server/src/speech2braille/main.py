@@ -8,7 +8,9 @@ from fastapi import FastAPI, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
 
 from speech2braille.config import Settings
+from speech2braille.dependencies import get_settings
 from speech2braille.routers import health_router, speech_router, tables_router, translation_router
+from speech2braille.scratch import ScratchPool
 from speech2braille.services.asr_service import ASRService
 from speech2braille.services.braille_service import BrailleService
 from speech2braille.services.table_service import TableService
@@ -30,13 +32,15 @@ def create_app(settings: Settings | None = None) -> FastAPI:
         Configured FastAPI application.
     """
     if settings is None:
-        settings = Settings()
+        settings = get_settings()
 
     # Create services
     asr_service = ASRService(settings.asr)
     braille_service = BrailleService(settings.braille)
     table_service = TableService(settings.braille)
     vad_service = VADService(settings.vad)
+    # Scratch files are only needed when the websocket hands audio to whisper.cpp on disk
+    scratch_pool = ScratchPool() if settings.websocket.use_scratch_files else None
 
     @asynccontextmanager
     async def lifespan(app: FastAPI):
@@ -50,6 +54,13 @@ def create_app(settings: Settings | None = None) -> FastAPI:
         app.state.vad_service = vad_service
         app.state.settings = settings
 
+        # The websocket handler spends most of its loop time on small socket reads and writes
+        if not type(asyncio.get_running_loop()).__module__.startswith("uvloop"):
+            logger.warning("Not running on uvloop; start uvicorn with --loop uvloop for lower streaming overhead")
+
+        if scratch_pool is not None:
+            scratch_pool.open()
+
         # Start ASR and VAD model loading in background
         asyncio.create_task(asr_service.load_model())
         asyncio.create_task(vad_service.load_model())
@@ -59,6 +70,8 @@ def create_app(settings: Settings | None = None) -> FastAPI:
         # Shutdown: Clean up
         logger.info("Shutting down Brailler API...")
         asr_service.unload()
+        if scratch_pool is not None:
+            scratch_pool.close()
 
     app = FastAPI(
         title=settings.app_title,
@@ -70,7 +83,7 @@ def create_app(settings: Settings | None = None) -> FastAPI:
     # Configure CORS
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=settings.cors.allow_origins,
+        allow_origins=settings.cors.allow_origins_set,
         allow_credentials=settings.cors.allow_credentials,
         allow_methods=settings.cors.allow_methods,
         allow_headers=settings.cors.allow_headers,
@@ -83,7 +96,7 @@ def create_app(settings: Settings | None = None) -> FastAPI:
     app.include_router(speech_router)
 
     # WebSocket endpoint
-    ws_handler = SpeechToBrailleWebSocket(asr_service, braille_service, vad_service, settings.websocket)
+    ws_handler = SpeechToBrailleWebSocket(asr_service, braille_service, vad_service, settings.websocket, scratch_pool)
 
     @app.websocket("/ws/speech-to-braille")
     async def websocket_speech_to_braille(websocket: WebSocket):
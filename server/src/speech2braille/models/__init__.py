@@ -4,6 +4,7 @@ from speech2braille.models.braille import (
     BackTranslationRequest,
     BackTranslationResponse,
     BrailleTable,
+    BrailleTableName,
     TranslationRequest,
     TranslationResponse,
 )
@@ -14,11 +15,14 @@ from speech2braille.models.transcription import (
     TranscriptionResponse,
     WordTimestamp,
 )
+from speech2braille.models.websocket import ControlMessage
 
 __all__ = [
     "BackTranslationRequest",
     "BackTranslationResponse",
     "BrailleTable",
+    "BrailleTableName",
+    "ControlMessage",
     "HealthResponse",
     "SegmentTimestamp",
     "SpeechToBrailleResponse",
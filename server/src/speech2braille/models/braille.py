@@ -1,7 +1,15 @@
 """Braille-related Pydantic models."""
 
+from typing import Annotated
+
 from pydantic import BaseModel, Field
 
+# Table filename, or comma-separated list of them (e.g. "unicode.dis,en-ueb-g2.ctb").
+# Declared once and reused so every model shares the same compiled pattern; it also
+# rejects path separators so requests cannot point liblouis outside its table paths.
+TABLE_NAME_PATTERN = r"^[A-Za-z0-9_-][A-Za-z0-9._-]*(,[A-Za-z0-9_-][A-Za-z0-9._-]*)*$"
+BrailleTableName = Annotated[str, Field(pattern=TABLE_NAME_PATTERN)]
+
 
 class BrailleTable(BaseModel):
     """Represents a braille translation table."""
@@ -16,7 +24,7 @@ class TranslationRequest(BaseModel):
     """Request model for text-to-braille translation."""
 
     text: str = Field(..., description="Text to translate to braille", min_length=1)
-    table: str = Field(..., description="Braille table filename to use")
+    table: BrailleTableName = Field(..., description="Braille table filename to use")
 
 
 class TranslationResponse(BaseModel):
@@ -24,7 +32,7 @@ class TranslationResponse(BaseModel):
 
     original_text: str = Field(..., description="Original input text")
     braille: str = Field(..., description="Translated braille text (Unicode braille)")
-    table_used: str = Field(..., description="Table filename used for translation")
+    table_used: BrailleTableName = Field(..., description="Table filename used for translation")
     success: bool = Field(..., description="Whether translation succeeded")
 
 
@@ -32,7 +40,7 @@ class BackTranslationRequest(BaseModel):
     """Request model for braille-to-text back-translation."""
 
     braille: str = Field(..., description="Braille text to translate back", min_length=1)
-    table: str = Field(..., description="Braille table filename to use")
+    table: BrailleTableName = Field(..., description="Braille table filename to use")
 
 
 class BackTranslationResponse(BaseModel):
@@ -40,5 +48,5 @@ class BackTranslationResponse(BaseModel):
 
     original_braille: str = Field(..., description="Original braille input")
     text: str = Field(..., description="Back-translated text")
-    table_used: str = Field(..., description="Table filename used")
+    table_used: BrailleTableName = Field(..., description="Table filename used")
     success: bool = Field(..., description="Whether back-translation succeeded")
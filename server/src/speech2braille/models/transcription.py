@@ -2,6 +2,8 @@
 
 from pydantic import BaseModel, Field
 
+from speech2braille.models.braille import BrailleTableName
+
 
 class WordTimestamp(BaseModel):
     """Word-level timestamp information."""
@@ -40,7 +42,7 @@ class SpeechToBrailleResponse(BaseModel):
     transcribed_text: str = Field(..., description="Transcribed speech")
     braille: str = Field(..., description="Braille output")
     language: str | None = Field(None, description="Detected language")
-    table_used: str = Field(..., description="Braille table used")
+    table_used: BrailleTableName = Field(..., description="Braille table used")
     audio_duration: float | None = Field(None, description="Audio duration")
     segments: list[SegmentTimestamp] | None = Field(None, description="Segment timestamps")
     success: bool = Field(..., description="Success status")
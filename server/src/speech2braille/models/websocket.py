@@ -0,0 +1,24 @@
+"""WebSocket message Pydantic models."""
+
+from typing import Any, Literal
+
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
+
+from speech2braille.models.braille import BrailleTableName
+
+_braille_table_name = TypeAdapter(BrailleTableName)
+
+
+class ControlMessage(BaseModel):
+    """Control message sent by the client as a WebSocket text frame."""
+
+    type: Literal["config", "start_recording", "stop_recording"] = Field(..., description="Message type")
+    config: dict[str, Any] = Field(default_factory=dict, description="Session config updates for 'config' messages")
+
+    @field_validator("config")
+    @classmethod
+    def validate_braille_table(cls, config: dict[str, Any]) -> dict[str, Any]:
+        """Hold the streaming table choice to the same filename rule as the HTTP models."""
+        if "braille_table" in config:
+            _braille_table_name.validate_python(config["braille_table"])
+        return config
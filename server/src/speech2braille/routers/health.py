@@ -1,7 +1,8 @@
 """Health check router."""
 
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, Request, Response
 
+from speech2braille.caching import etag_matches, make_etag, not_modified
 from speech2braille.models.health import HealthResponse
 from speech2braille.services.asr_service import ASRService
 from speech2braille.services.braille_service import BrailleService
@@ -10,16 +11,30 @@ router = APIRouter(tags=["health"])
 
 
 @router.get("/", response_model=HealthResponse)
-async def health_check(request: Request) -> HealthResponse:
-    """Health check endpoint with ASR status."""
+async def health_check(request: Request, response: Response) -> HealthResponse | Response:
+    """Health check endpoint with ASR status.
+
+    Returns 304 Not Modified when the client's If-None-Match ETag is still current,
+    so pollers only receive a body when the ASR status actually changes.
+    """
     asr_service: ASRService = request.app.state.asr_service
     braille_service: BrailleService = request.app.state.braille_service
 
+    liblouis_version = braille_service.get_version()
+    asr_status = asr_service.get_status()
+    asr_model = asr_service.get_model_name()
+    asr_device = asr_service.device if asr_service.is_loaded else None
+
+    etag = make_etag(liblouis_version, asr_status, asr_model, asr_device)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    response.headers["ETag"] = etag
     return HealthResponse(
         status="ok",
         message="Brailler API is running",
-        liblouis_version=braille_service.get_version(),
-        asr_status=asr_service.get_status(),
-        asr_model=asr_service.get_model_name(),
-        asr_device=asr_service.device if asr_service.is_loaded else None,
+        liblouis_version=liblouis_version,
+        asr_status=asr_status,
+        asr_model=asr_model,
+        asr_device=asr_device,
     )
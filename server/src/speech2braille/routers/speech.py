@@ -1,19 +1,43 @@
 """Speech transcription router."""
 
-import contextlib
-import os
-import tempfile
-from pathlib import Path
+import asyncio
+from collections.abc import AsyncIterator
 
+import orjson
 from fastapi import APIRouter, File, HTTPException, Query, Request, UploadFile
-
-from speech2braille.models.transcription import SpeechToBrailleResponse, TranscriptionResponse
-from speech2braille.services.asr_service import ASRService
+from fastapi.responses import StreamingResponse
+
+from speech2braille.audio import decode_to_whisper_pcm
+from speech2braille.models.braille import TABLE_NAME_PATTERN
+from speech2braille.models.transcription import (
+    SegmentTimestamp,
+    SpeechToBrailleResponse,
+    TranscriptionResponse,
+)
+from speech2braille.services.asr_service import ASRService, TranscribedSegment
 from speech2braille.services.braille_service import BrailleService
 
 router = APIRouter(prefix="/api", tags=["speech"])
 
 
+def _construct_segments(segments: list[TranscribedSegment] | None) -> list[SegmentTimestamp] | None:
+    """Build segment models from trusted ASR output without re-running validation."""
+    if segments is None:
+        return None
+
+    return [
+        SegmentTimestamp.model_construct(
+            id=segment.id,
+            start=segment.start,
+            end=segment.end,
+            text=segment.text,
+            avg_logprob=segment.avg_logprob,
+            no_speech_prob=segment.no_speech_prob,
+        )
+        for segment in segments
+    ]
+
+
 @router.post("/transcribe", response_model=TranscriptionResponse)
 async def transcribe_speech(
     request: Request,
@@ -42,34 +66,71 @@ async def transcribe_speech(
         else:
             raise HTTPException(503, "ASR model not loaded")
 
-    # Save uploaded file temporarily
-    with tempfile.NamedTemporaryFile(delete=False, suffix=Path(audio.filename or "audio.wav").suffix) as tmp:
-        content = await audio.read()
-        tmp.write(content)
-        tmp_path = tmp.name
+    # Decode and resample directly from the spooled upload, off the event loop
+    try:
+        pcm = await asyncio.to_thread(decode_to_whisper_pcm, audio.file)
+    except ValueError as e:
+        raise HTTPException(400, str(e))
 
     try:
-        result = await asr_service.transcribe(
-            tmp_path,
+        result = await asr_service.transcribe_array(
+            pcm,
             language=language,
             task=task,
             word_timestamps=word_timestamps,
         )
-        return TranscriptionResponse(**result)
+        # Result is built by ASRService, so skip re-validating it
+        return TranscriptionResponse.model_construct(**{**result, "segments": _construct_segments(result["segments"])})
 
     except RuntimeError as e:
         raise HTTPException(500, str(e))
 
-    finally:
-        with contextlib.suppress(OSError):
-            os.unlink(tmp_path)
+
+@router.post("/transcribe/stream")
+async def transcribe_speech_stream(
+    request: Request,
+    audio: UploadFile = File(..., description="Audio file (WAV, MP3, OGG, etc.)"),
+    language: str = Query(..., description="Language code (e.g., 'en', 'es') - required"),
+    task: str = "transcribe",
+) -> StreamingResponse:
+    """Transcribe speech, streaming each segment as soon as whisper.cpp decodes it.
+
+    Responds with newline-delimited JSON, one {"id", "start", "end", "text"} object
+    per segment, so clients can start braille translation before the clip finishes.
+
+    Args:
+        audio: Audio file upload
+        language: Language code (e.g., 'en', 'es') - required
+        task: 'transcribe' (in original language) or 'translate' (to English)
+    """
+    asr_service: ASRService = request.app.state.asr_service
+
+    if not asr_service.is_loaded:
+        if asr_service.is_loading:
+            raise HTTPException(503, "ASR model is loading...")
+        elif asr_service.error:
+            raise HTTPException(500, f"ASR model failed: {asr_service.error}")
+        else:
+            raise HTTPException(503, "ASR model not loaded")
+
+    # Decode and resample directly from the spooled upload, off the event loop
+    try:
+        pcm = await asyncio.to_thread(decode_to_whisper_pcm, audio.file)
+    except ValueError as e:
+        raise HTTPException(400, str(e))
+
+    async def ndjson_lines() -> AsyncIterator[bytes]:
+        async for segment in asr_service.transcribe_segments(pcm, language=language, task=task):
+            yield orjson.dumps(segment) + b"\n"
+
+    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
 
 
 @router.post("/speech-to-braille", response_model=SpeechToBrailleResponse)
 async def speech_to_braille(
     request: Request,
     audio: UploadFile = File(..., description="Audio file"),
-    braille_table: str = "en-ueb-g2.ctb",
+    braille_table: str = Query("en-ueb-g2.ctb", pattern=TABLE_NAME_PATTERN),
     language: str = Query(..., description="Language code (e.g., 'en', 'es') - required"),
     task: str = "transcribe",
     word_timestamps: bool = False,
@@ -97,16 +158,16 @@ async def speech_to_braille(
         else:
             raise HTTPException(503, "ASR model not loaded")
 
-    # Save uploaded file temporarily
-    with tempfile.NamedTemporaryFile(delete=False, suffix=Path(audio.filename or "audio.wav").suffix) as tmp:
-        content = await audio.read()
-        tmp.write(content)
-        tmp_path = tmp.name
+    # Decode and resample directly from the spooled upload, off the event loop
+    try:
+        pcm = await asyncio.to_thread(decode_to_whisper_pcm, audio.file)
+    except ValueError as e:
+        raise HTTPException(400, str(e))
 
     try:
         # Step 1: Transcribe speech
-        transcription_result = await asr_service.transcribe(
-            tmp_path,
+        transcription_result = await asr_service.transcribe_array(
+            pcm,
             language=language,
             task=task,
             word_timestamps=word_timestamps,
@@ -115,15 +176,15 @@ async def speech_to_braille(
 
         # Step 2: Translate to braille
         try:
-            braille = braille_service.translate(transcribed_text, braille_table)
+            braille = await asyncio.to_thread(braille_service.translate, transcribed_text, braille_table)
 
-            return SpeechToBrailleResponse(
+            return SpeechToBrailleResponse.model_construct(
                 transcribed_text=transcribed_text,
                 braille=braille,
                 language=transcription_result.get("language"),
                 table_used=braille_table,
                 audio_duration=transcription_result.get("duration"),
-                segments=transcription_result.get("segments"),
+                segments=_construct_segments(transcription_result.get("segments")),
                 success=True,
             )
 
@@ -132,7 +193,3 @@ async def speech_to_braille(
 
     except RuntimeError as e:
         raise HTTPException(500, str(e))
-
-    finally:
-        with contextlib.suppress(OSError):
-            os.unlink(tmp_path)
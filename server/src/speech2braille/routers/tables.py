@@ -1,7 +1,8 @@
 """Braille tables router."""
 
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, Request, Response
 
+from speech2braille.caching import etag_matches, make_etag, not_modified
 from speech2braille.models.braille import BrailleTable
 from speech2braille.services.table_service import TableService
 
@@ -9,10 +10,17 @@ router = APIRouter(prefix="/api", tags=["tables"])
 
 
 @router.get("/tables", response_model=list[BrailleTable])
-async def list_tables(request: Request) -> list[BrailleTable]:
+async def list_tables(request: Request, response: Response) -> list[BrailleTable] | Response:
     """List all available braille translation tables.
 
     Scans liblouis table directories and returns metadata for each table.
+    Returns 304 Not Modified when the client's If-None-Match ETag is still current.
     """
     table_service: TableService = request.app.state.table_service
+
+    etag = make_etag(*table_service.get_directories_signature())
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    response.headers["ETag"] = etag
     return table_service.list_tables()
@@ -1,6 +1,8 @@
 """Braille translation router."""
 
-from fastapi import APIRouter, HTTPException, Request
+import asyncio
+
+from fastapi import APIRouter, HTTPException, Request, Response
 
 from speech2braille.models.braille import (
     BackTranslationRequest,
@@ -22,8 +24,10 @@ async def translate_to_braille(request: Request, body: TranslationRequest) -> Tr
     braille_service: BrailleService = request.app.state.braille_service
 
     try:
-        braille = braille_service.translate(body.text, body.table)
-        return TranslationResponse(
+        # Run liblouis off the event loop
+        braille = await asyncio.to_thread(braille_service.translate, body.text, body.table)
+        # Fields come from the already-validated request, so skip re-validating the response
+        return TranslationResponse.model_construct(
             original_text=body.text,
             braille=braille,
             table_used=body.table,
@@ -33,6 +37,26 @@ async def translate_to_braille(request: Request, body: TranslationRequest) -> Tr
         raise HTTPException(status_code=400, detail=f"Translation failed: {str(e)}")
 
 
+@router.post(
+    "/translate/raw",
+    response_class=Response,
+    responses={200: {"content": {"text/plain": {}}, "description": "UTF-8 encoded Unicode braille"}},
+)
+async def translate_to_braille_raw(request: Request, body: TranslationRequest) -> Response:
+    """Translate text to braille and return the braille itself as the response body.
+
+    Skips the JSON envelope for clients that forward braille straight to a display.
+    """
+    braille_service: BrailleService = request.app.state.braille_service
+
+    try:
+        braille = await asyncio.to_thread(braille_service.translate_utf8, body.text, body.table)
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Translation failed: {str(e)}")
+
+    return Response(content=braille, media_type="text/plain; charset=utf-8")
+
+
 @router.post("/back-translate", response_model=BackTranslationResponse)
 async def back_translate_from_braille(request: Request, body: BackTranslationRequest) -> BackTranslationResponse:
     """Back-translate braille to text using the specified table.
@@ -42,8 +66,8 @@ async def back_translate_from_braille(request: Request, body: BackTranslationReq
     braille_service: BrailleService = request.app.state.braille_service
 
     try:
-        text = braille_service.back_translate(body.braille, body.table)
-        return BackTranslationResponse(
+        text = await asyncio.to_thread(braille_service.back_translate, body.braille, body.table)
+        return BackTranslationResponse.model_construct(
             original_braille=body.braille,
             text=text,
             table_used=body.table,
@@ -65,8 +89,8 @@ async def test_translation(request: Request) -> TranslationResponse:
     test_table = "en-ueb-g2.ctb"
 
     try:
-        braille = braille_service.translate(test_text, test_table)
-        return TranslationResponse(
+        braille = await asyncio.to_thread(braille_service.translate, test_text, test_table)
+        return TranslationResponse.model_construct(
             original_text=test_text,
             braille=braille,
             table_used=test_table,
@@ -0,0 +1,62 @@
+"""Reusable scratch files for code paths that need audio on disk."""
+
+import asyncio
+import logging
+import os
+import shutil
+import tempfile
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# tmpfs keeps scratch audio in memory instead of on a block device
+SHM_DIR = "/dev/shm"
+
+
+class ScratchPool:
+    """Fixed pool of preallocated scratch files, checked out one per request.
+
+    Files are created once on open() and overwritten in place by each user, which
+    avoids creating and unlinking a temp file for every request.
+    """
+
+    def __init__(self, size: int | None = None, suffix: str = ".wav") -> None:
+        self.size = size or 2 * (os.cpu_count() or 1)
+        self.suffix = suffix
+        self._directory: str | None = None
+        self._free: asyncio.Queue[str] | None = None
+
+    def open(self) -> None:
+        """Create the scratch directory and its files."""
+        parent = SHM_DIR if os.path.isdir(SHM_DIR) else None
+        self._directory = tempfile.mkdtemp(prefix="speech2braille-", dir=parent)
+        self._free = asyncio.Queue()
+        for i in range(self.size):
+            path = Path(self._directory) / f"scratch-{i}{self.suffix}"
+            path.touch()
+            self._free.put_nowait(str(path))
+        logger.info(f"Scratch pool ready: {self.size} files in {self._directory}")
+
+    def close(self) -> None:
+        """Remove the scratch directory and its files."""
+        if self._directory is not None:
+            shutil.rmtree(self._directory, ignore_errors=True)
+            self._directory = None
+            self._free = None
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[str]:
+        """Check out a scratch file path, waiting if every file is in use.
+
+        The file keeps whatever the previous user wrote; writers must overwrite it.
+        """
+        if self._free is None:
+            raise RuntimeError("Scratch pool is not open")
+        free = self._free
+        path = await free.get()
+        try:
+            yield path
+        finally:
+            free.put_nowait(path)
@@ -1,12 +1,23 @@
 """ASR (Automatic Speech Recognition) service using whisper.cpp via pywhispercpp."""
 
+import asyncio
 import logging
+import math
+import os
 import re
+import threading
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
+import _pywhispercpp as pw
+import numpy as np
+from pywhispercpp.constants import AVAILABLE_MODELS, MODELS_DIR
 from pywhispercpp.model import Model
 
+from speech2braille.audio import WHISPER_SAMPLE_RATE, to_whisper_pcm
 from speech2braille.config import ASRConfig
 
 # Pattern to match noise annotations like [INAUDIBLE], (music), (keyboard clicking), etc.
@@ -27,27 +38,141 @@ NOISE_PATTERN = re.compile(
 logger = logging.getLogger(__name__)
 
 
+def _strip_noise(text: str) -> str:
+    """Remove noise annotations from segment text, skipping the regex when there are no brackets."""
+    if "[" not in text and "(" not in text:
+        return text.strip()
+    return NOISE_PATTERN.sub('', text).strip()
+
+
+def _model_file(model_id: str) -> Path:
+    """Locate the GGML file for a model path or a pywhispercpp model name."""
+    model_file = Path(model_id)
+    if model_file.is_file():
+        return model_file
+    # Named models live in pywhispercpp's models dir once downloaded
+    return MODELS_DIR / f"ggml-{model_id}.bin"
+
+
+def _resolve_model_name(model_name: str, quantization: str | None) -> str:
+    """Prefer the quantized GGML variant of a named model when one is published.
+
+    The quantized file is used if it is already downloaded, or if nothing is downloaded
+    yet so the first download fetches the smaller file. An existing full-precision
+    download is kept rather than triggering a fetch on an offline device.
+    """
+    quantized = f"{model_name}-{quantization}"
+    if not quantization or quantized not in AVAILABLE_MODELS:
+        return model_name
+    if _model_file(quantized).is_file() or not _model_file(model_name).is_file():
+        return quantized
+    logger.warning(f"Using full-precision {model_name}; download {quantized} for faster inference")
+    return model_name
+
+
+def _prefetch_model_file(model_id: str) -> None:
+    """Ask the kernel to read a local GGML model file into the page cache.
+
+    whisper.cpp reads the whole file at init; hinting sequential access first lets
+    the kernel start large readahead before those reads arrive on a cold start.
+    """
+    model_file = _model_file(model_id)
+    if not model_file.is_file() or not hasattr(os, "posix_fadvise"):
+        return
+
+    try:
+        fd = os.open(model_file, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        logger.debug(f"Prefetching model file: {model_file}")
+    except OSError as e:
+        logger.debug(f"Model prefetch skipped: {e}")
+    finally:
+        os.close(fd)
+
+
+def _available_cpus() -> int:
+    """Count the CPUs this process may run on (respects affinity and cpusets)."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+@dataclass(slots=True)
+class TranscribedSegment:
+    """One transcribed segment, as returned in ``segments`` by ASRService.transcribe."""
+
+    id: int
+    start: float
+    end: float
+    text: str
+    avg_logprob: float
+    no_speech_prob: float = 0.0  # Not available in whisper.cpp
+
+
 @dataclass
 class ASRState:
     """State of the ASR model."""
 
     model: Model | None = None
+    model_name: str | None = None
     loaded: bool = False
     loading: bool = False
     error: str | None = None
 
 
+def _clear_segment_callback(model: Model) -> None:
+    """Unregister the segment callback pywhispercpp leaves on the model's params.
+
+    The bindings cannot reset the C callback pointer, so the params are rebuilt from
+    whisper.cpp's defaults plus the ones the model was constructed with.
+    """
+    model._params = pw.whisper_full_default_params(model._sampling_strategy)
+    model._set_params(model.params)
+    Model._new_segment_callback = None
+
+
+def _log_abandoned_inference(inference: asyncio.Task) -> None:
+    """Log the failure of an inference whose stream was closed before it finished."""
+    if not inference.cancelled() and (e := inference.exception()) is not None:
+        logger.error(f"Streaming inference failed after the client left: {e}")
+
+
 class ASRService:
     """Service for speech recognition using whisper.cpp."""
 
     def __init__(self, asr_config: ASRConfig) -> None:
         self.asr_config = asr_config
         self.state = ASRState()
+        # One whisper.cpp context serves every request, so inference calls queue here and run
+        # one at a time off the event loop. The thread lock is taken inside the worker thread,
+        # so exclusivity holds even after an awaiting task has been cancelled.
+        self._inference_lock = asyncio.Lock()
+        self._model_lock = threading.Lock()
+        # Decode settings shared by every inference call, built once from the (constant) config
+        self._decode_params = MappingProxyType({
+            # Quality thresholds
+            "entropy_thold": asr_config.entropy_thold,
+            "logprob_thold": asr_config.logprob_thold,
+            "no_speech_thold": asr_config.no_speech_thold,
+            # Streaming optimization
+            "temperature": asr_config.temperature,
+            "split_on_word": asr_config.split_on_word,
+        })
 
     @property
     def model_name(self) -> str:
         return self.asr_config.model_path or self.asr_config.model_name
 
+    @property
+    def n_threads(self) -> int:
+        """Inference thread count, resolved from the host when not configured."""
+        return self.asr_config.n_threads or _available_cpus()
+
     @property
     def is_loaded(self) -> bool:
         return self.state.loaded
@@ -67,6 +192,45 @@ class ASRService:
             return "cpu"
         return None
 
+    def _parallel_processors(self, audio: str | np.ndarray) -> int | None:
+        """Pick a whisper_full_parallel processor count for audio long enough to split."""
+        n_processors = self.asr_config.n_processors
+        if n_processors <= 1 or not isinstance(audio, np.ndarray):
+            return None
+        chunk_samples = int(self.asr_config.parallel_min_chunk_s * WHISPER_SAMPLE_RATE)
+        n_processors = min(n_processors, audio.size // chunk_samples)
+        return n_processors if n_processors > 1 else None
+
+    def _transcribe_locked(self, model: Any, audio: str | np.ndarray, kwargs: dict[str, Any]) -> list[Any]:
+        """Run model.transcribe on the calling (worker) thread with the context held."""
+        with self._model_lock:
+            try:
+                return model.transcribe(audio, **kwargs)
+            finally:
+                if "new_segment_callback" in kwargs:
+                    _clear_segment_callback(model)
+
+    async def _run_model(self, audio: str | np.ndarray, **kwargs: Any) -> list[Any]:
+        """Run one whisper.cpp inference in a worker thread, queued behind any in flight.
+
+        whisper.cpp cannot be interrupted, so if the caller is cancelled the queue stays
+        held until the thread returns and the next call never overlaps it.
+        """
+        model = self.state.model
+        # pywhispercpp keeps params on the model across calls, so clear any prompt left by the
+        # previous caller (e.g. another streaming session) unless this call sets its own
+        kwargs.setdefault("initial_prompt", "")
+        # Every parallel decoder runs n_threads threads, so split the budget between them
+        # (set on every call, so a parallel call doesn't leave the next one short of threads)
+        kwargs["n_threads"] = max(1, self.n_threads // (kwargs.get("n_processors") or 1))
+        async with self._inference_lock:
+            inference = asyncio.ensure_future(asyncio.to_thread(self._transcribe_locked, model, audio, kwargs))
+            try:
+                return await asyncio.shield(inference)
+            except asyncio.CancelledError:
+                await asyncio.wait([inference])
+                raise
+
     def get_status(self) -> str:
         """Get current ASR status string."""
         if self.state.loaded:
@@ -78,7 +242,7 @@ class ASRService:
     def get_model_name(self) -> str | None:
         """Get the model name if loaded."""
         if self.state.loaded:
-            return f"whisper.cpp-{self.asr_config.model_name}"
+            return f"whisper.cpp-{self.state.model_name}"
         return None
 
     async def load_model(self) -> None:
@@ -87,26 +251,34 @@ class ASRService:
             return
 
         self.state.loading = True
-        model_id = self.asr_config.model_path or self.asr_config.model_name
+        model_name = self.asr_config.model_name
+        if not self.asr_config.model_path:
+            model_name = _resolve_model_name(model_name, self.asr_config.quantization)
+        model_id = self.asr_config.model_path or model_name
         logger.info(f"Loading whisper.cpp model: {model_id}")
 
         try:
+            _prefetch_model_file(model_id)
+
             # Note: suppress_non_speech_tokens is in pywhispercpp PARAMS_SCHEMA but
             # not exposed in the C bindings (v1.4.1). Only suppress_blank works here.
             model = Model(
                 model=model_id,
-                n_threads=self.asr_config.n_threads,
+                n_threads=self.n_threads,
                 print_progress=False,
                 print_realtime=False,
                 suppress_blank=self.asr_config.suppress_blank,
             )
 
             self.state.model = model
+            self.state.model_name = model_name
+            if self.asr_config.warmup:
+                await self._warmup()
             self.state.loaded = True
             self.state.loading = False
 
             logger.info(
-                f"whisper.cpp loaded: {model_id} with {self.asr_config.n_threads} threads, "
+                f"whisper.cpp loaded: {model_id} with {self.n_threads} threads, "
                 f"suppress_blank={self.asr_config.suppress_blank}"
             )
 
@@ -116,9 +288,20 @@ class ASRService:
             self.state.loading = False
             self.state.loaded = False
 
+    async def _warmup(self) -> None:
+        """Run one short silent inference so buffer allocation and page-in happen at load time."""
+        try:
+            await self._run_model(
+                np.zeros(WHISPER_SAMPLE_RATE, dtype=np.float32),
+                language=self.asr_config.default_language,
+            )
+            logger.info("whisper.cpp warmup complete")
+        except Exception as e:
+            logger.warning(f"whisper.cpp warmup failed: {e!s}")
+
     async def transcribe(
         self,
-        audio_path: str,
+        audio_path: str | np.ndarray,
         language: str,
         task: str = "transcribe",
         word_timestamps: bool = False,
@@ -126,7 +309,7 @@ class ASRService:
         """Transcribe audio using whisper.cpp.
 
         Args:
-            audio_path: Path to audio file
+            audio_path: Path to audio file, or 16 kHz mono float32 PCM
             language: Language code (REQUIRED - cannot be None)
             task: 'transcribe' or 'translate'
             word_timestamps: Include word-level timestamps (not supported in whisper.cpp)
@@ -149,23 +332,20 @@ class ASRService:
             else:
                 raise RuntimeError("ASR model not loaded")
 
-        logger.info(f"Transcribing: {audio_path} (language={language}, task={task})")
-        model = self.state.model
+        source = "<pcm buffer>" if isinstance(audio_path, np.ndarray) else audio_path
+        logger.info(f"Transcribing: {source} (language={language}, task={task})")
 
-        # Transcribe with whisper.cpp
+        # Transcribe with whisper.cpp, splitting long audio across parallel decoders
         translate = task == "translate"
-        segments = model.transcribe(
+        segments = await self._run_model(
             audio_path,
+            n_processors=self._parallel_processors(audio_path),
             language=language,
             translate=translate,
-            extract_probability=True,
-            # Quality thresholds
-            entropy_thold=self.asr_config.entropy_thold,
-            logprob_thold=self.asr_config.logprob_thold,
-            no_speech_thold=self.asr_config.no_speech_thold,
-            # Streaming optimization
-            temperature=self.asr_config.temperature,
-            split_on_word=self.asr_config.split_on_word,
+            # Per-segment probabilities cost a Python loop over every token, so only
+            # compute them when segment details are returned
+            extract_probability=word_timestamps,
+            **self._decode_params,
         )
 
         # Process segments
@@ -173,38 +353,47 @@ class ASRService:
         segment_list = []
         max_time = 0.0
 
+        # Convert whisper.cpp's np.float32 probabilities (NaN when missing) in one vectorized pass
+        probabilities: list[float] = []
+        if word_timestamps:
+            probabilities = np.nan_to_num(
+                np.fromiter(
+                    (getattr(segment, "probability", np.nan) for segment in segments),
+                    dtype=np.float64,
+                    count=len(segments),
+                ),
+                nan=0.0,
+            ).tolist()
+
         for idx, segment in enumerate(segments):
             # Filter out noise annotations from segment text
-            clean_text = NOISE_PATTERN.sub('', segment.text).strip()
+            clean_text = _strip_noise(segment.text)
             if not clean_text:
                 continue  # Skip segments that are only noise
             full_text.append(clean_text)
 
             # t0 and t1 are in centiseconds (1/100 second)
-            start_sec = float(segment.t0) / 100.0
             end_sec = float(segment.t1) / 100.0
             max_time = max(max_time, end_sec)
 
-            # Convert numpy float32 to native Python float for JSON serialization
-            probability = getattr(segment, "probability", 0.0)
-            if probability is None:
-                probability = 0.0
-
-            segment_data = {
-                "id": idx,
-                "start": start_sec,
-                "end": end_sec,
-                "text": clean_text,
-                "avg_logprob": float(probability),
-                "no_speech_prob": 0.0,  # Not available in whisper.cpp
-            }
+            # Segment details are only returned when requested, so don't build them otherwise
+            if not word_timestamps:
+                continue
 
             # Note: whisper.cpp doesn't provide word-level timestamps
             # in the same way as faster-whisper
+            segment_list.append(
+                TranscribedSegment(
+                    id=idx,
+                    start=float(segment.t0) / 100.0,
+                    end=end_sec,
+                    text=clean_text,
+                    avg_logprob=probabilities[idx],
+                )
+            )
 
-            segment_list.append(segment_data)
-
-        transcription = " ".join(full_text).strip()
+        # Pieces are already stripped and non-empty, so the joined text needs no strip
+        transcription = " ".join(full_text)
         logger.info(f"Transcribed: {transcription[:100]}...")
 
         return {
@@ -215,23 +404,121 @@ class ASRService:
             "success": True,
         }
 
+    async def transcribe_array(
+        self,
+        audio: np.ndarray,
+        language: str,
+        task: str = "transcribe",
+        word_timestamps: bool = False,
+        sample_rate: int = WHISPER_SAMPLE_RATE,
+    ) -> dict[str, Any]:
+        """Transcribe in-memory PCM samples without a temp-file round-trip.
+
+        Args:
+            audio: PCM samples shaped (frames,) or (frames, channels)
+            language: Language code (REQUIRED - cannot be None)
+            task: 'transcribe' or 'translate'
+            word_timestamps: Include word-level timestamps (not supported in whisper.cpp)
+            sample_rate: Sample rate of the input audio (resampled to 16 kHz if different)
+
+        Returns:
+            Dict with text, language, duration, segments, success
+        """
+        pcm = to_whisper_pcm(audio, sample_rate)
+        return await self.transcribe(pcm, language=language, task=task, word_timestamps=word_timestamps)
+
+    async def transcribe_segments(
+        self,
+        audio: np.ndarray,
+        language: str,
+        task: str = "transcribe",
+        sample_rate: int = WHISPER_SAMPLE_RATE,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Transcribe in-memory PCM samples, yielding each segment as whisper.cpp decodes it.
+
+        Args:
+            audio: PCM samples shaped (frames,) or (frames, channels)
+            language: Language code (REQUIRED - cannot be None)
+            task: 'transcribe' or 'translate'
+            sample_rate: Sample rate of the input audio (resampled to 16 kHz if different)
+
+        Yields:
+            Dicts with id, start, end, text (noise-only segments are skipped)
+        """
+        if not language:
+            raise ValueError("Language is required for transcription")
+
+        if not self.state.loaded:
+            if self.state.loading:
+                raise RuntimeError("ASR model is loading...")
+            elif self.state.error:
+                raise RuntimeError(f"ASR model failed: {self.state.error}")
+            else:
+                raise RuntimeError("ASR model not loaded")
+
+        pcm = to_whisper_pcm(audio, sample_rate)
+        loop = asyncio.get_running_loop()
+        segments: asyncio.Queue[Any] = asyncio.Queue()
+        stopped = threading.Event()
+
+        def on_segment(segment: Any) -> None:
+            # Runs on the inference thread, which keeps going if the client leaves early
+            if not stopped.is_set():
+                loop.call_soon_threadsafe(segments.put_nowait, segment)
+
+        inference = asyncio.create_task(
+            self._run_model(
+                pcm,
+                new_segment_callback=on_segment,
+                language=language,
+                translate=task == "translate",
+                **self._decode_params,
+            )
+        )
+        # Segment callbacks are scheduled before the inference result, so this lands last
+        inference.add_done_callback(lambda _: segments.put_nowait(None))
+
+        try:
+            idx = 0
+            while (segment := await segments.get()) is not None:
+                clean_text = _strip_noise(segment.text)
+                if clean_text:
+                    yield {
+                        "id": idx,
+                        "start": float(segment.t0) / 100.0,
+                        "end": float(segment.t1) / 100.0,
+                        "text": clean_text,
+                    }
+                idx += 1
+            await inference
+        finally:
+            # Not cancelled on early exit: no point, whisper.cpp runs to completion either way.
+            # Its outcome is still retrieved, so a failure is logged instead of left unretrieved.
+            stopped.set()
+            if not inference.done():
+                inference.add_done_callback(_log_abandoned_inference)
+
     async def transcribe_streaming(
         self,
-        audio_path: str,
+        audio_path: str | np.ndarray,
         language: str,
         initial_prompt: str | None = None,
         task: str = "transcribe",
+        skip_seconds: float = 0.0,
     ) -> dict[str, Any]:
         """Transcribe audio for streaming with context carryover support.
 
         Args:
-            audio_path: Path to audio file
+            audio_path: Path to audio file, or 16 kHz mono float32 PCM
             language: Language code (REQUIRED)
             initial_prompt: Previous transcription text for context continuity
             task: 'transcribe' or 'translate'
+            skip_seconds: Leading audio already transcribed with the previous window;
+                segments ending inside it are dropped
 
         Returns:
-            Dict with text, language, duration, last_words (for next chunk's context), success
+            Dict with text, language, duration, last_words (for next chunk's context),
+            overlap_words (leading words that may repeat the skipped audio), success
         """
         if not language:
             raise ValueError("Language is required for transcription")
@@ -244,47 +531,51 @@ class ASRService:
             else:
                 raise RuntimeError("ASR model not loaded")
 
-        logger.debug(f"Streaming transcribe: {audio_path} (prompt={initial_prompt[:30] if initial_prompt else None}...)")
-        model = self.state.model
+        if logger.isEnabledFor(logging.DEBUG):
+            source = "<pcm buffer>" if isinstance(audio_path, np.ndarray) else audio_path
+            logger.debug("Streaming transcribe: %s (prompt=%.30s...)", source, initial_prompt)
 
         # Build transcribe kwargs
         translate = task == "translate"
         transcribe_kwargs: dict[str, Any] = {
             "language": language,
             "translate": translate,
-            "extract_probability": True,
-            # Quality thresholds
-            "entropy_thold": self.asr_config.entropy_thold,
-            "logprob_thold": self.asr_config.logprob_thold,
-            "no_speech_thold": self.asr_config.no_speech_thold,
-            # Streaming optimization
-            "temperature": self.asr_config.temperature,
-            "split_on_word": self.asr_config.split_on_word,
+            # Only text and end times are used here, so skip per-token probability extraction
+            "extract_probability": False,
+            **self._decode_params,
         }
 
-        # Add initial prompt for context carryover if provided
-        if initial_prompt:
-            # pywhispercpp uses prompt_tokens parameter
-            # We pass the text and let whisper.cpp tokenize it
-            transcribe_kwargs["initial_prompt"] = initial_prompt
+        # Initial prompt for context carryover; always passed (empty when unset) because
+        # pywhispercpp would otherwise reuse the previous call's prompt. whisper.cpp tokenizes it.
+        transcribe_kwargs["initial_prompt"] = initial_prompt or ""
 
-        segments = model.transcribe(audio_path, **transcribe_kwargs)
+        segments = await self._run_model(audio_path, **transcribe_kwargs)
 
         # Process segments
         full_text = []
         max_time = 0.0
+        overlap_words = 0
 
         for segment in segments:
+            end_sec = float(segment.t1) / 100.0
+            if end_sec <= skip_seconds:
+                continue
+
             # Filter out noise annotations
-            clean_text = NOISE_PATTERN.sub('', segment.text).strip()
+            clean_text = _strip_noise(segment.text)
             if not clean_text:
                 continue
+            start_sec = float(segment.t0) / 100.0
+            if not full_text and start_sec < skip_seconds:
+                # The first kept segment straddles the skipped audio; estimate how many of its
+                # words were spoken there from the share of its duration that lies inside
+                share = (skip_seconds - start_sec) / (end_sec - start_sec)
+                overlap_words = math.ceil(len(clean_text.split()) * share)
             full_text.append(clean_text)
-
-            end_sec = float(segment.t1) / 100.0
             max_time = max(max_time, end_sec)
 
-        transcription = " ".join(full_text).strip()
+        # Pieces are already stripped and non-empty, so the joined text needs no strip
+        transcription = " ".join(full_text)
 
         # Extract last few words for context carryover (limit to ~50 chars)
         last_words = ""
@@ -298,13 +589,14 @@ class ASRService:
                 last_words = last_words[-50:]
 
         if transcription:
-            logger.info(f"Streaming transcribed: {transcription[:50]}...")
+            logger.debug("Streaming transcribed: %.50s...", transcription)
 
         return {
             "text": transcription,
             "language": language,
             "duration": float(max_time),
             "last_words": last_words,  # For context carryover to next chunk
+            "overlap_words": overlap_words,
             "success": True,
         }
 
@@ -1,6 +1,8 @@
 """Braille translation service using liblouis."""
 
 import logging
+import threading
+from functools import lru_cache
 
 import louis
 
@@ -8,12 +10,19 @@ from speech2braille.config import BrailleConfig
 
 logger = logging.getLogger(__name__)
 
+# liblouis keeps global translation buffers, so calls into it from worker threads run one at a time
+_louis_lock = threading.Lock()
+
 
 class BrailleService:
     """Service for braille translation using liblouis."""
 
     def __init__(self, config: BrailleConfig) -> None:
         self.config = config
+        # liblouis output is deterministic per (text, table), and streaming chunks repeat short phrases
+        self._translate_cached = lru_cache(maxsize=config.translation_cache_size)(self._translate_uncached)
+        self._translate_utf8_cached = lru_cache(maxsize=config.translation_cache_size)(self._translate_utf8_uncached)
+        self._back_translate_cached = lru_cache(maxsize=config.translation_cache_size)(self._back_translate_uncached)
 
     @property
     def default_table(self) -> str:
@@ -27,6 +36,8 @@ class BrailleService:
     def translate(self, text: str, table: str | None = None) -> str:
         """Translate text to braille.
 
+        Results are memoized per (text, table) up to ``translation_cache_size`` entries.
+
         Args:
             text: Text to translate
             table: Braille table filename (uses default if not specified)
@@ -34,8 +45,29 @@ class BrailleService:
         Returns:
             Unicode braille string
         """
-        table = table or self.default_table
-        braille_output = louis.translate([table], text, mode=louis.dotsIO | louis.ucBrl)
+        return self._translate_cached(text, table or self.default_table)
+
+    def translate_utf8(self, text: str, table: str | None = None) -> bytes:
+        """Translate text to braille, returning the Unicode braille UTF-8 encoded.
+
+        The encoded bytes are memoized alongside translate()'s string results.
+
+        Args:
+            text: Text to translate
+            table: Braille table filename (uses default if not specified)
+
+        Returns:
+            UTF-8 encoded Unicode braille
+        """
+        return self._translate_utf8_cached(text, table or self.default_table)
+
+    def _translate_utf8_uncached(self, text: str, table: str) -> bytes:
+        return self._translate_cached(text, table).encode("utf-8")
+
+    @staticmethod
+    def _translate_uncached(text: str, table: str) -> str:
+        with _louis_lock:
+            braille_output = louis.translate([table], text, mode=louis.dotsIO | louis.ucBrl)
 
         # Extract the Unicode braille string from the tuple
         braille = braille_output[0] if isinstance(braille_output, tuple) else braille_output
@@ -44,6 +76,8 @@ class BrailleService:
     def back_translate(self, braille: str, table: str | None = None) -> str:
         """Back-translate braille to text.
 
+        Results are memoized per (braille, table) like translate().
+
         Args:
             braille: Braille text to translate back
             table: Braille table filename (uses default if not specified)
@@ -51,5 +85,9 @@ class BrailleService:
         Returns:
             Text string
         """
-        table = table or self.default_table
-        return louis.backTranslateString([table], braille)
+        return self._back_translate_cached(braille, table or self.default_table)
+
+    @staticmethod
+    def _back_translate_uncached(braille: str, table: str) -> str:
+        with _louis_lock:
+            return louis.backTranslateString([table], braille)
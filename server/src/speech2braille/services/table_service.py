@@ -2,33 +2,75 @@
 
 import logging
 import os
-from pathlib import Path
+import re
+import time
+from pathlib import Path, PurePath
 
 from speech2braille.config import BrailleConfig
 from speech2braille.models.braille import BrailleTable
 
 logger = logging.getLogger(__name__)
 
+# liblouis reads metadata from the leading comment block, so only the start of a table is scanned
+TABLE_HEADER_BYTES = 8192
+# Directory existence is re-checked at most this often; table changes are caught by mtime
+TABLE_DIRECTORIES_TTL_S = 5.0
+METADATA_PATTERN = re.compile(rb"^[ \t]*#-(display-name|language):(.*)$", re.MULTILINE)
+GRADE_PATTERN = re.compile(r"[-_]g([12])")
+
+# Common language names
+LANGUAGE_NAMES = {
+    "en": "English",
+    "es": "Spanish",
+    "fr": "French",
+    "de": "German",
+    "it": "Italian",
+    "pt": "Portuguese",
+    "nl": "Dutch",
+    "sv": "Swedish",
+    "no": "Norwegian",
+    "da": "Danish",
+    "fi": "Finnish",
+    "pl": "Polish",
+    "cs": "Czech",
+    "ru": "Russian",
+    "ar": "Arabic",
+    "zh": "Chinese",
+    "ja": "Japanese",
+    "ko": "Korean",
+}
+
 
 class TableService:
     """Service for discovering and parsing braille tables."""
 
     def __init__(self, config: BrailleConfig) -> None:
         self.config = config
+        # (directory mtime signature, tables) from the last scan
+        self._tables_cache: tuple[tuple[tuple[str, int], ...], list[BrailleTable]] | None = None
+        # (monotonic expiry, directories) from the last directory lookup
+        self._directories_cache: tuple[float, list[Path]] | None = None
 
     def get_table_directories(self) -> list[Path]:
-        """Get list of directories where liblouis tables are stored."""
+        """Get list of directories where liblouis tables are stored.
+
+        The lookup is reused for TABLE_DIRECTORIES_TTL_S seconds.
+        """
+        now = time.monotonic()
+        if self._directories_cache is not None and now < self._directories_cache[0]:
+            return list(self._directories_cache[1])
+
         directories = []
 
         # Check configured paths
         for path_str in self.config.table_directories:
             path = Path(path_str)
-            if path.exists() and path.is_dir():
+            if path.is_dir():
                 directories.append(path)
 
         # Also check user local path
         user_local = Path.home() / ".local/share/liblouis/tables"
-        if user_local.exists() and user_local.is_dir():
+        if user_local.is_dir():
             directories.append(user_local)
 
         # Also check LOUIS_TABLEPATH environment variable
@@ -36,10 +78,11 @@ class TableService:
         if env_path:
             for path_str in env_path.split(":"):
                 path = Path(path_str)
-                if path.exists() and path.is_dir() and path not in directories:
+                if path.is_dir() and path not in directories:
                     directories.append(path)
 
-        return directories
+        self._directories_cache = (now + TABLE_DIRECTORIES_TTL_S, directories)
+        return list(directories)
 
     @staticmethod
     def parse_table_metadata(table_file: Path) -> dict:
@@ -50,18 +93,18 @@ class TableService:
         }
 
         try:
-            with open(table_file, encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if line.startswith("#-display-name:"):
-                        metadata["display_name"] = line.split(":", 1)[1].strip()
-                    elif line.startswith("#-language:"):
-                        metadata["language"] = line.split(":", 1)[1].strip()
-                    # Stop after reading header lines
-                    if metadata["display_name"] and metadata["language"]:
-                        break
-        except Exception:
-            pass
+            with open(table_file, "rb") as f:
+                header = f.read(TABLE_HEADER_BYTES)
+        except OSError:
+            return metadata
+
+        for match in METADATA_PATTERN.finditer(header):
+            key = "display_name" if match[1] == b"display-name" else "language"
+            if not metadata[key]:
+                metadata[key] = match[2].decode("utf-8", "replace").strip()
+            # Stop after reading header lines
+            if metadata["display_name"] and metadata["language"]:
+                break
 
         return metadata
 
@@ -75,55 +118,59 @@ class TableService:
         }
 
         # Extract language code (usually first 2-3 chars before hyphen)
-        parts = filename.replace(".ctb", "").replace(".utb", "").split("-")
-        if len(parts) >= 1:
-            metadata["language"] = parts[0]
+        language = PurePath(filename).stem.split("-", 1)[0]
+        metadata["language"] = language
 
         # Detect grade
-        if "-g1" in filename or "_g1" in filename:
-            metadata["grade"] = "g1"
-            metadata["display_name"] = f"{parts[0].upper()} Grade 1"
-        elif "-g2" in filename or "_g2" in filename:
-            metadata["grade"] = "g2"
-            metadata["display_name"] = f"{parts[0].upper()} Grade 2"
-
-        # Common language names
-        lang_names = {
-            "en": "English",
-            "es": "Spanish",
-            "fr": "French",
-            "de": "German",
-            "it": "Italian",
-            "pt": "Portuguese",
-            "nl": "Dutch",
-            "sv": "Swedish",
-            "no": "Norwegian",
-            "da": "Danish",
-            "fi": "Finnish",
-            "pl": "Polish",
-            "cs": "Czech",
-            "ru": "Russian",
-            "ar": "Arabic",
-            "zh": "Chinese",
-            "ja": "Japanese",
-            "ko": "Korean",
-        }
+        grade_match = GRADE_PATTERN.search(filename)
+        grade = grade_match[1] if grade_match else None
+        if grade:
+            metadata["grade"] = f"g{grade}"
+            metadata["display_name"] = f"{language.upper()} Grade {grade}"
 
-        if metadata["language"] in lang_names:
-            base_name = lang_names[metadata["language"]]
-            if metadata["grade"]:
-                metadata["display_name"] = f"{base_name} Grade {metadata['grade'][1]}"
-            else:
-                metadata["display_name"] = base_name
+        base_name = LANGUAGE_NAMES.get(language)
+        if base_name:
+            metadata["display_name"] = f"{base_name} Grade {grade}" if grade else base_name
 
         return metadata
 
+    @staticmethod
+    def _directories_signature(directories: list[Path]) -> tuple[tuple[str, int], ...]:
+        """Snapshot directory mtimes, which change whenever a table is added, removed or renamed."""
+        signature = []
+        for directory in directories:
+            try:
+                mtime_ns = directory.stat().st_mtime_ns
+            except OSError:
+                mtime_ns = -1  # Removed since the (cached) directory lookup
+            signature.append((str(directory), mtime_ns))
+        return tuple(signature)
+
+    def get_directories_signature(self) -> tuple[tuple[str, int], ...]:
+        """Get the (path, mtime) signature of the current table directories."""
+        return self._directories_signature(self.get_table_directories())
+
     def list_tables(self) -> list[BrailleTable]:
-        """List all available braille translation tables."""
+        """List all available braille translation tables.
+
+        The scan result is cached and reused until one of the table directories changes.
+        """
+        directories = self.get_table_directories()
+        signature = self._directories_signature(directories)
+
+        if self._tables_cache is not None and self._tables_cache[0] == signature:
+            return list(self._tables_cache[1])
+
+        tables = self._scan_tables(directories)
+        self._tables_cache = (signature, tables)
+        return list(tables)
+
+    def _scan_tables(self, directories: list[Path]) -> list[BrailleTable]:
+        """Scan table directories and build metadata for each table."""
         tables = []
         seen_filenames: set[str] = set()
 
-        for directory in self.get_table_directories():
+        for directory in directories:
             for table_file in directory.glob("*.ctb"):
                 filename = table_file.name
 
@@ -1,11 +1,13 @@
 """Voice Activity Detection service using Silero VAD."""
 
+import copy
 import logging
 from dataclasses import dataclass
 
 import numpy as np
 import torch
 from silero_vad import load_silero_vad, VADIterator
+from silero_vad.utils_vad import OnnxWrapper
 
 from speech2braille.config import VADConfig
 
@@ -34,63 +36,64 @@ class VADSessionState:
     silence_duration: float = 0.0
 
 
-class VADService:
-    """Voice Activity Detection service."""
+class _ProbabilityRecorder:
+    """Wraps the Silero model so VADIterator's own forward pass also reports the frame probability.
 
-    def __init__(self, config: VADConfig):
-        self.config = config
-        self.model = None
-        self.iterator = None
-        self.is_loaded = False
-        self.error = None
+    The model is stateful, so each frame must go through it exactly once.
+    """
 
-    async def load_model(self) -> None:
-        """Load Silero VAD model with fallback to WebRTC."""
-        if not self.config.enabled:
-            logger.info("VAD disabled, using fixed-interval processing")
-            return
+    def __init__(self, model) -> None:
+        self.model = model
+        self.last_probability = 0.5
+
+    def __call__(self, x: torch.Tensor, sr: int) -> torch.Tensor:
+        output = self.model(x, sr)
+        self.last_probability = float(output.item())
+        return output
+
+    def reset_states(self) -> None:
+        self.model.reset_states()
 
-        try:
-            self.model = load_silero_vad()
-            self.iterator = VADIterator(
-                self.model,
-                threshold=self.config.threshold,
-                sampling_rate=self.config.sample_rate,
-                min_silence_duration_ms=self.config.min_silence_duration_ms,
-                speech_pad_ms=self.config.speech_pad_ms,
-            )
-            self.is_loaded = True
-            logger.info("Silero VAD loaded successfully")
-        except Exception as e:
-            logger.error(f"VAD loading failed: {e}")
-            self.error = str(e)
-            self.is_loaded = False
+
+class VADStream:
+    """VAD over one session's audio.
+
+    Silero carries hidden state from frame to frame, so each session runs its own copy of the
+    model and its own iterator; interleaved sessions would otherwise corrupt each other's state.
+    """
+
+    def __init__(self, model, config: VADConfig):
+        self.config = config
+        self._recorder = _ProbabilityRecorder(model)
+        self.iterator = VADIterator(
+            self._recorder,
+            threshold=config.threshold,
+            sampling_rate=config.sample_rate,
+            min_silence_duration_ms=config.min_silence_duration_ms,
+            speech_pad_ms=config.speech_pad_ms,
+        )
+        # Fixed-size frame reused for every call; the tensor shares its memory
+        self._frame_buf = np.zeros(config.frame_size_samples, dtype=np.float32)
+        self._frame_tensor = torch.from_numpy(self._frame_buf)
+        # Tail of the last chunk that did not fill a frame, completed by the next chunk
+        self._remainder = np.zeros(config.frame_size_samples, dtype=np.float32)
+        self._remainder_len = 0
 
     def process_frame(self, audio_chunk: np.ndarray) -> VADResult:
         """Process audio frame and return VAD result."""
-        if not self.is_loaded:
-            # Fallback: assume speech to avoid missing input
-            return VADResult(is_speech=True, probability=0.5)
-
         try:
-            # Convert numpy to torch tensor
-            audio_tensor = torch.from_numpy(audio_chunk).float()
+            # Ensure exactly frame_size_samples (Silero VAD requires 512 for 16kHz):
+            # keep the last frame_size_samples if too long, zero-pad the tail if too short
+            n = min(len(audio_chunk), self.config.frame_size_samples)
+            self._frame_buf[:n] = audio_chunk[len(audio_chunk) - n :]
+            self._frame_buf[n:] = 0.0
 
-            # Ensure exactly frame_size_samples (Silero VAD requires 512 for 16kHz)
-            if len(audio_tensor) < self.config.frame_size_samples:
-                # Pad if too short
-                audio_tensor = torch.nn.functional.pad(
-                    audio_tensor, (0, self.config.frame_size_samples - len(audio_tensor))
-                )
-            elif len(audio_tensor) > self.config.frame_size_samples:
-                # Take only the last frame_size_samples if too long
-                audio_tensor = audio_tensor[-self.config.frame_size_samples :]
+            # Get speech event (the single model forward also records the probability)
+            speech_dict = self.iterator(self._frame_tensor, return_seconds=False)
 
-            # Get speech event
-            speech_dict = self.iterator(audio_tensor, return_seconds=False)
-
-            is_speech = speech_dict is None  # None = speech continues
-            probability = self._get_probability(audio_tensor)
+            # The iterator stays triggered from a speech start until its end event
+            is_speech = bool(self.iterator.triggered)
+            probability = self._recorder.last_probability
 
             result = VADResult(is_speech=is_speech, probability=probability)
 
@@ -107,13 +110,85 @@ class VADService:
             logger.error(f"VAD processing error: {e}")
             return VADResult(is_speech=True, probability=0.5)
 
-    def reset_session(self) -> None:
-        """Reset VAD state for new session."""
-        if self.iterator:
-            self.iterator.reset_states()
+    def process_chunk(self, audio_chunk: np.ndarray) -> list[VADResult]:
+        """Run VAD over every full frame of a chunk.
+
+        Samples that do not fill a frame are carried over to the next chunk rather than
+        zero-padded, so chunk sizes that are not a multiple of the frame size see real audio.
+        """
+        size = self.config.frame_size_samples
+        results = []
+        start = 0
+        if self._remainder_len:
+            start = min(size - self._remainder_len, len(audio_chunk))
+            self._remainder[self._remainder_len : self._remainder_len + start] = audio_chunk[:start]
+            self._remainder_len += start
+            if self._remainder_len < size:
+                return results
+            results.append(self.process_frame(self._remainder))
+            self._remainder_len = 0
+
+        end = start + (len(audio_chunk) - start) // size * size
+        results.extend(self.process_frame(audio_chunk[i : i + size]) for i in range(start, end, size))
+
+        self._remainder_len = len(audio_chunk) - end
+        self._remainder[: self._remainder_len] = audio_chunk[end:]
+        return results
+
+    def reset(self) -> None:
+        """Reset VAD state for a new utterance."""
+        self.iterator.reset_states()
+        self._remainder_len = 0
+
+
+class VADService:
+    """Voice Activity Detection service."""
+
+    def __init__(self, config: VADConfig):
+        self.config = config
+        self.model = None
+        self.is_loaded = False
+        self.error = None
 
-    def _get_probability(self, audio_tensor: torch.Tensor) -> float:
-        """Get raw speech probability from model."""
-        if self.model:
-            return float(self.model(audio_tensor, self.config.sample_rate).item())
-        return 0.5
+    async def load_model(self) -> None:
+        """Load Silero VAD model with fallback to WebRTC."""
+        if not self.config.enabled:
+            logger.info("VAD disabled, using fixed-interval processing")
+            return
+
+        try:
+            self.model = self._load_silero()
+            # Warm up with a few silent frames so lazy initialization happens now;
+            # sessions get fresh copies of the model, so the state left behind does not matter
+            stream = VADStream(self.model, self.config)
+            silence = np.zeros(self.config.frame_size_samples, dtype=np.float32)
+            for _ in range(3):
+                stream.process_frame(silence)
+            self.model.reset_states()
+
+            self.is_loaded = True
+            logger.info("Silero VAD loaded successfully")
+        except Exception as e:
+            logger.error(f"VAD loading failed: {e}")
+            self.error = str(e)
+            self.is_loaded = False
+
+    def _load_silero(self):
+        """Load the Silero VAD model, preferring the ONNX Runtime build."""
+        if self.config.onnx:
+            try:
+                model = load_silero_vad(onnx=True)
+                logger.info("Using ONNX Runtime for Silero VAD")
+                return model
+            except ImportError:
+                logger.warning("onnxruntime not installed, falling back to PyTorch Silero VAD")
+        return load_silero_vad()
+
+    def create_stream(self) -> VADStream | None:
+        """Create VAD state for a new session, or None if VAD is not loaded."""
+        if not self.is_loaded:
+            return None
+        # The ONNX inference session is stateless and can be shared; only the wrapper's state is copied
+        model = copy.copy(self.model) if isinstance(self.model, OnnxWrapper) else copy.deepcopy(self.model)
+        model.reset_states()
+        return VADStream(model, self.config)
@@ -1,38 +1,110 @@
 """WebSocket handler for real-time speech-to-braille streaming."""
 
-import contextlib
-import json
+import asyncio
 import logging
-import os
-import tempfile
+import string
 import time
+from collections.abc import Mapping
 from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, NamedTuple
 
 import numpy as np
+import orjson
 import soundfile as sf
 from fastapi import WebSocket, WebSocketDisconnect
+from pydantic import ValidationError
 
+from speech2braille.audio import to_whisper_pcm
 from speech2braille.config import WebSocketConfig
+from speech2braille.models.websocket import ControlMessage
+from speech2braille.scratch import ScratchPool
 from speech2braille.services.asr_service import ASRService
 from speech2braille.services.braille_service import BrailleService
-from speech2braille.services.vad_service import VADService, VADResult, VADSessionState
+from speech2braille.services.vad_service import VADService, VADResult, VADSessionState, VADStream
 
 logger = logging.getLogger(__name__)
 
+# Wire formats a client may select for binary audio frames via config["audio_dtype"]
+AUDIO_DTYPES = {"float32": np.dtype(np.float32), "int16": np.dtype(np.int16)}
+INT16_SCALE = np.float32(1.0 / 32768.0)
+
+# How far back the previous window's text is searched for words repeated by the overlap
+OVERLAP_MATCH_WORDS = 10
+
+
+async def _send(websocket: WebSocket, message: dict) -> None:
+    """Send a message as a JSON text frame, encoded with orjson instead of json.dumps."""
+    await websocket.send_text(orjson.dumps(message, option=orjson.OPT_SERIALIZE_NUMPY).decode())
+
+
+def _trim_repeated_words(previous: str, text: str, max_words: int) -> str:
+    """Drop leading words of text that repeat the end of the previous window's text.
+
+    Only the first max_words words (those the ASR places inside the overlap) are candidates,
+    so speech that genuinely repeats itself after the overlap ("no, no") is kept.
+    """
+    words = text.split()
+    limit = min(max_words, OVERLAP_MATCH_WORDS)
+    head = [w.strip(string.punctuation).lower() for w in words[:limit]]
+    tail = [w.strip(string.punctuation).lower() for w in previous.split()[-limit:]]
+    for n in range(min(len(head), len(tail)), 0, -1):
+        if head[:n] == tail[-n:]:
+            return " ".join(words[n:])
+    return text
+
+
+class QueuedWindow(NamedTuple):
+    """Audio window waiting for the inference worker."""
+
+    audio: np.ndarray
+    config: Mapping[str, Any]  # Session config snapshot taken when the window was queued
+    overlap_seconds: float  # Leading audio shared with the previous window
+    partial: bool  # Provisional hypothesis rather than a final window
+    recording: int  # StreamingSession.recording_id when queued
+
+
+def _drop_queued_window(queue: asyncio.Queue[QueuedWindow]) -> QueuedWindow:
+    """Remove a queued partial if there is one, else the oldest window, and return it.
+
+    Partials are superseded by their window's result anyway, so they go before any
+    window whose text would be missing from the transcript.
+    """
+    items = [queue.get_nowait() for _ in range(queue.qsize())]
+    for _ in items:
+        queue.task_done()
+    dropped = items.pop(next((i for i, item in enumerate(items) if item.partial), 0))
+    for item in items:
+        queue.put_nowait(item)
+    return dropped
+
 
 @dataclass
 class StreamingSession:
     """Tracks state for a streaming speech-to-braille session."""
 
-    # Audio buffering
-    audio_buffer: list[np.ndarray] = field(default_factory=list)
-    buffer_duration: float = 0.0
+    # Audio buffering: preallocated sample buffer, filled up to write_idx. The first
+    # overlap_idx samples are the tail of the previous window; buffer_samples counts
+    # only the new audio after them.
+    audio_buffer: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float32))
+    write_idx: int = 0
+    overlap_idx: int = 0
+    buffer_samples: int = 0
+    speech_duration: float = 0.0  # VAD-detected speech in the new audio, in seconds
     is_recording: bool = False
 
+    # Windows waiting for the inference worker
+    inference_queue: asyncio.Queue[QueuedWindow] = field(default_factory=asyncio.Queue)
+    recording_id: int = 0  # Bumped on every reset, so windows of an earlier recording are ignored
+    inference_busy: bool = False  # The worker is transcribing a window it took off the queue
+    partial_mark: int = 0  # buffer_samples when the last partial was queued
+
     # Context carryover for better continuity
     last_transcription: str = ""  # Text from previous chunk for context prompt
-    accumulated_text: str = ""  # Full session transcript
-    accumulated_braille: str = ""  # Full session braille
+    overlap_text: str = ""  # Last words of the previous window, to trim repeats from the overlap
+    # Full session transcript and braille, one entry per window; joined once on stop_recording
+    accumulated_text_parts: list[str] = field(default_factory=list)
+    accumulated_braille_parts: list[str] = field(default_factory=list)
 
     # Session config
     config: dict = field(default_factory=lambda: {
@@ -40,28 +112,87 @@ class StreamingSession:
         "task": "transcribe",
         "braille_table": "",
         "word_timestamps": True,
+        "audio_dtype": "float32",
     })
 
     # VAD-specific state
     vad_state: VADSessionState = field(default_factory=VADSessionState)
+    vad_stream: VADStream | None = None
     last_vad_probability: float = 0.0
     consecutive_silence_frames: int = 0
 
+    @property
+    def buffered_audio(self) -> np.ndarray:
+        """View of the samples buffered so far (no copy)."""
+        return self.audio_buffer[:self.write_idx]
+
+    def append_audio(self, chunk: np.ndarray) -> np.ndarray:
+        """Copy a chunk into the buffer, growing it only if the chunk overruns capacity.
+
+        int16 chunks are scaled to float32 straight into the buffer in one pass.
+
+        Returns:
+            View of the buffer holding the appended float32 samples
+        """
+        end = self.write_idx + len(chunk)
+        if end > len(self.audio_buffer):
+            grown = np.empty(max(end, 2 * len(self.audio_buffer)), dtype=np.float32)
+            grown[:self.write_idx] = self.audio_buffer[:self.write_idx]
+            self.audio_buffer = grown
+        target = self.audio_buffer[self.write_idx:end]
+        if chunk.dtype == np.int16:
+            np.multiply(chunk, INT16_SCALE, out=target, dtype=np.float32)
+        else:
+            target[:] = chunk
+        self.write_idx = end
+        self.buffer_samples = end - self.overlap_idx
+        return target
+
+    def keep_tail(self, samples: int) -> None:
+        """Restart the buffer with its last samples as overlap for the next window."""
+        tail = min(samples, self.write_idx)
+        self.audio_buffer[:tail] = self.audio_buffer[self.write_idx - tail:self.write_idx]
+        self.write_idx = self.overlap_idx = tail
+        self.buffer_samples = 0
+        self.partial_mark = 0
+        self.speech_duration = 0.0
+
+    def config_snapshot(self) -> Mapping[str, Any]:
+        """Read-only copy of the config, so later config messages cannot change a queued window."""
+        return MappingProxyType(dict(self.config))
+
     def reset_buffer(self) -> None:
         """Reset the audio buffer while preserving context."""
-        self.audio_buffer = []
-        self.buffer_duration = 0.0
+        self.write_idx = 0
+        self.overlap_idx = 0
+        self.buffer_samples = 0
+        self.partial_mark = 0
+        self.speech_duration = 0.0
+
+    def discard_queued(self) -> None:
+        """Drop every window still waiting for the inference worker."""
+        while not self.inference_queue.empty():
+            self.inference_queue.get_nowait()
+            self.inference_queue.task_done()
 
     def reset_session(self) -> None:
-        """Reset entire session state for new recording."""
-        self.audio_buffer = []
-        self.buffer_duration = 0.0
+        """Reset entire session state for new recording.
+
+        Queued windows are discarded, and one already being transcribed is ignored when it
+        finishes, so nothing from the previous recording reaches the new one.
+        """
+        self.discard_queued()
+        self.recording_id += 1
+        self.reset_buffer()
         self.is_recording = False
         self.last_transcription = ""
-        self.accumulated_text = ""
-        self.accumulated_braille = ""
+        self.overlap_text = ""
+        self.accumulated_text_parts = []
+        self.accumulated_braille_parts = []
         # Reset VAD state
         self.vad_state = VADSessionState()
+        if self.vad_stream is not None:
+            self.vad_stream.reset()
         self.last_vad_probability = 0.0
         self.consecutive_silence_frames = 0
 
@@ -75,48 +206,74 @@ class SpeechToBrailleWebSocket:
         braille_service: BrailleService,
         vad_service: VADService,
         config: WebSocketConfig,
+        scratch_pool: ScratchPool | None = None,
     ) -> None:
         self.asr_service = asr_service
         self.braille_service = braille_service
         self.vad_service = vad_service
         self.config = config
+        self.scratch_pool = scratch_pool
+
+        # Trigger thresholds in samples, so the per-chunk checks are integer compares
+        self._min_samples = int(config.min_duration * config.sample_rate)
+        self._chunk_samples = int(config.chunk_duration * config.sample_rate)
+        self._limit_samples = int(config.buffer_limit * config.sample_rate)
+        self._partial_samples = int(config.partial_interval * config.sample_rate)
 
     async def handle(self, websocket: WebSocket) -> None:
         """Handle a WebSocket connection for speech-to-braille streaming."""
         await websocket.accept()
         logger.info("WebSocket connected")
 
+        worker: asyncio.Task | None = None
         try:
             if not self.asr_service.is_loaded:
-                await websocket.send_json({"type": "error", "message": "ASR model not loaded"})
+                await _send(websocket, {"type": "error", "message": "ASR model not loaded"})
                 await websocket.close()
                 return
 
-            await websocket.send_json({
+            await _send(websocket, {
                 "type": "ready",
                 "model": self.asr_service.get_model_name(),
                 "device": self.asr_service.device,
             })
 
-            # Initialize session with StreamingSession dataclass
-            session = StreamingSession()
+            # Initialize session; the buffer is sized for a full window so appends rarely reallocate
+            window_seconds = self.config.buffer_limit + self.config.context_window_seconds
+            session = StreamingSession(
+                audio_buffer=np.empty(int(window_seconds * self.config.sample_rate), dtype=np.float32),
+                inference_queue=asyncio.Queue(maxsize=self.config.inference_queue_size),
+            )
             session.config["braille_table"] = self.braille_service.default_table
 
+            # Transcription runs off the receive loop so audio keeps buffering meanwhile
+            worker = asyncio.create_task(self._inference_worker(websocket, session))
+
             while True:
                 data = await websocket.receive()
 
+                # Audio chunks (checked first: they are nearly every frame)
+                if (audio_bytes := data.get("bytes")) is not None:
+                    await self._handle_audio_chunk(websocket, audio_bytes, session)
+
                 # Config/command messages
-                if "text" in data:
-                    await self._handle_text_message(websocket, data["text"], session)
+                elif (text := data.get("text")) is not None:
+                    await self._handle_text_message(websocket, text, session)
 
-                # Audio chunks
-                elif "bytes" in data:
-                    await self._handle_audio_chunk(websocket, data["bytes"], session)
+                elif data["type"] == "websocket.disconnect":
+                    raise WebSocketDisconnect(data.get("code", 1000), data.get("reason"))
 
         except WebSocketDisconnect:
             logger.info("WebSocket disconnected")
         except Exception as e:
             logger.error(f"WebSocket error: {e}")
+        finally:
+            if worker is not None:
+                # Nobody is left to receive queued windows. Cancelling an in-flight window is safe:
+                # ASRService keeps whisper.cpp locked until that inference thread returns.
+                session.discard_queued()
+                worker.cancel()
+                await asyncio.gather(worker, return_exceptions=True)
 
     async def _handle_text_message(
         self,
@@ -126,49 +283,62 @@ class SpeechToBrailleWebSocket:
     ) -> None:
         """Handle a text message (config or command)."""
         try:
-            message = json.loads(text)
-
-            if message.get("type") == "config":
-                new_config = message.get("config", {})
-                # Validate language - it cannot be null or empty for whisper.cpp
-                if "language" in new_config and not new_config["language"]:
-                    await websocket.send_json({
-                        "type": "error",
-                        "message": "Language is required and cannot be null or empty",
-                    })
-                    return
-                session.config.update(new_config)
-                await websocket.send_json({"type": "config_updated", "config": session.config})
-
-            elif message.get("type") == "start_recording":
-                # Reset session for new recording
-                session.reset_session()
-                session.is_recording = True
-                await websocket.send_json({"type": "recording_started"})
-
-            elif message.get("type") == "stop_recording":
-                # Process any remaining audio
-                if session.audio_buffer and session.buffer_duration >= self.config.min_duration:
-                    await self._process_audio(websocket, session)
-
-                # Send final accumulated result if we have content
-                if session.accumulated_text:
-                    await websocket.send_json({
-                        "type": "final_result",
-                        "transcribed_text": session.accumulated_text,
-                        "braille": session.accumulated_braille,
-                        "language": session.config.get("language"),
-                        "table_used": session.config.get("braille_table"),
-                        "success": True,
-                    })
-
-                session.reset_session()
-                await websocket.send_json({"type": "recording_stopped"})
-
-        except json.JSONDecodeError as e:
-            await websocket.send_json({"type": "error", "message": f"Invalid JSON: {str(e)}"})
+            # Parsed and validated once, straight from the raw frame text; unknown types fail validation
+            message = ControlMessage.model_validate_json(text)
+
+            match message.type:
+                case "config":
+                    new_config = message.config
+                    # Validate language - it cannot be null or empty for whisper.cpp
+                    if "language" in new_config and not new_config["language"]:
+                        await _send(websocket, {
+                            "type": "error",
+                            "message": "Language is required and cannot be null or empty",
+                        })
+                        return
+                    if "audio_dtype" in new_config and new_config["audio_dtype"] not in AUDIO_DTYPES:
+                        await _send(websocket, {
+                            "type": "error",
+                            "message": f"audio_dtype must be one of: {', '.join(AUDIO_DTYPES)}",
+                        })
+                        return
+                    session.config.update(new_config)
+                    await _send(websocket, {"type": "config_updated", "config": session.config})
+
+                case "start_recording":
+                    # Reset session for new recording
+                    session.reset_session()
+                    session.is_recording = True
+                    await _send(websocket, {"type": "recording_started"})
+
+                case "stop_recording":
+                    # Process any remaining audio, then wait for every queued window
+                    if (
+                        session.buffer_samples > 0
+                        and session.buffer_samples >= self._min_samples
+                        and self._has_speech(session)
+                    ):
+                        await self._enqueue_audio(websocket, session, wait=True)
+                    await session.inference_queue.join()
+
+                    # Send final accumulated result if we have content
+                    if session.accumulated_text_parts:
+                        await _send(websocket, {
+                            "type": "final_result",
+                            "transcribed_text": " ".join(session.accumulated_text_parts),
+                            "braille": " ".join(session.accumulated_braille_parts),
+                            "language": session.config.get("language"),
+                            "table_used": session.config.get("braille_table"),
+                            "success": True,
+                        })
+
+                    session.reset_session()
+                    await _send(websocket, {"type": "recording_stopped"})
+
+        except ValidationError as e:
+            await _send(websocket, {"type": "error", "message": f"Invalid message: {str(e)}"})
         except Exception as e:
-            await websocket.send_json({"type": "error", "message": str(e)})
+            await _send(websocket, {"type": "error", "message": str(e)})
 
     async def _handle_audio_chunk(
         self,
@@ -178,124 +348,234 @@ class SpeechToBrailleWebSocket:
     ) -> None:
         """Handle an audio chunk."""
         try:
-            audio_chunk = np.frombuffer(audio_bytes, dtype=np.float32)
-            if len(audio_chunk) == 0:
+            # Zero-copy view of the frame; append_audio does the only copy (and int16 scaling)
+            wire_chunk = np.frombuffer(audio_bytes, dtype=AUDIO_DTYPES[session.config["audio_dtype"]])
+            if len(wire_chunk) == 0:
                 return
 
-            session.audio_buffer.append(audio_chunk)
-            session.buffer_duration = sum(len(c) for c in session.audio_buffer) / self.config.sample_rate
+            audio_chunk = session.append_audio(wire_chunk)
 
             if not session.is_recording:
                 session.is_recording = True
-                await websocket.send_json({"type": "speech_started"})
-
-            # Run VAD if enabled
-            if self.vad_service.is_loaded:
-                vad_result = self.vad_service.process_frame(audio_chunk)
-                session.last_vad_probability = vad_result.probability
-
-                # Update VAD state
-                self._update_vad_state(session, vad_result)
+                await _send(websocket, {"type": "speech_started"})
+
+            # Run VAD if enabled (the model may finish loading after the session started)
+            if session.vad_stream is None:
+                session.vad_stream = self.vad_service.create_stream()
+            if session.vad_stream is not None:
+                frame_seconds = self.vad_service.config.frame_size_samples / self.vad_service.config.sample_rate
+                speech_end = False
+                for vad_result in session.vad_stream.process_chunk(audio_chunk):
+                    # Update VAD state
+                    self._update_vad_state(session, vad_result)
+                    if vad_result.is_speech:
+                        session.speech_duration += frame_seconds
+                    speech_end = speech_end or vad_result.speech_end
+                    session.last_vad_probability = vad_result.probability
 
                 # Check if we should trigger ASR
-                if self._should_process_audio(session, vad_result):
-                    await self._process_audio(websocket, session)
-                    session.reset_buffer()
-                    self.vad_service.reset_session()
+                if self._should_process_audio(session, speech_end):
+                    if self._has_speech(session):
+                        await self._enqueue_audio(websocket, session)
+                    else:
+                        # Nothing worth transcribing in this window
+                        logger.debug("No speech in window, skipping ASR")
+                        session.reset_buffer()
+                    session.vad_state = VADSessionState()
+                    session.vad_stream.reset()
+
+                    # Endpoint: the window was flushed without waiting for chunk_duration
+                    if speech_end:
+                        await _send(websocket, {"type": "speech_ended"})
             else:
                 # Fallback to fixed-interval (existing logic)
-                if session.buffer_duration >= self.config.chunk_duration and session.buffer_duration >= self.config.min_duration:
-                    await self._process_audio(websocket, session)
-                    session.reset_buffer()
+                if session.buffer_samples >= self._chunk_samples and session.buffer_samples >= self._min_samples:
+                    await self._enqueue_audio(websocket, session)
 
                 # Force process if buffer limit reached (safety fallback)
-                elif session.buffer_duration >= self.config.buffer_limit:
-                    await self._process_audio(websocket, session)
-                    session.reset_buffer()
+                elif session.buffer_samples >= self._limit_samples:
+                    await self._enqueue_audio(websocket, session)
+
+            # Provisional hypothesis while the window is still filling, only when the worker is idle:
+            # nothing in flight and nothing queued (which also means no partial is pending)
+            if (
+                self._partial_samples
+                and not session.inference_busy
+                and session.inference_queue.empty()
+                and session.buffer_samples - session.partial_mark >= self._partial_samples
+                and self._has_speech(session)
+            ):
+                self._enqueue_partial(session)
 
         except Exception as e:
-            await websocket.send_json({"type": "error", "message": str(e)})
-
-    async def _process_audio(
-        self,
-        websocket: WebSocket,
-        session: StreamingSession,
-    ) -> None:
-        """Process buffered audio and send results with context carryover."""
-        if not session.audio_buffer:
+            await _send(websocket, {"type": "error", "message": str(e)})
+
+    async def _enqueue_audio(self, websocket: WebSocket, session: StreamingSession, wait: bool = False) -> None:
+        """Hand the buffered window to the inference worker and clear the buffer.
+
+        The last context_window_seconds of audio stay in the buffer so the next window
+        starts with them. When the worker has fallen behind, a queued partial is dropped
+        first, then the oldest waiting window, so the transcript stays close to real time.
+        With wait=True (stop_recording, which waits for every window anyway) nothing is
+        dropped; the call waits for room in the queue instead.
+        """
+        queue = session.inference_queue
+        overlap_seconds = session.overlap_idx / self.config.sample_rate
+        item = QueuedWindow(
+            session.buffered_audio.copy(), session.config_snapshot(), overlap_seconds, False, session.recording_id
+        )
+        session.keep_tail(int(self.config.context_window_seconds * self.config.sample_rate))
+
+        if wait:
+            await queue.put(item)
             return
+        if queue.full() and not _drop_queued_window(queue).partial:
+            logger.warning("Inference queue full, dropped oldest audio window")
+            await _send(websocket, {
+                "type": "queue_full",
+                "message": "Transcription is falling behind; dropped the oldest audio window",
+            })
+        queue.put_nowait(item)
+
+    def _enqueue_partial(self, session: StreamingSession) -> None:
+        """Queue a snapshot of the window filled so far for a partial hypothesis."""
+        overlap_seconds = session.overlap_idx / self.config.sample_rate
+        session.partial_mark = session.buffer_samples
+        item = QueuedWindow(
+            session.buffered_audio.copy(), session.config_snapshot(), overlap_seconds, True, session.recording_id
+        )
+        session.inference_queue.put_nowait(item)
+
+    async def _inference_worker(self, websocket: WebSocket, session: StreamingSession) -> None:
+        """Transcribe queued windows in order until cancelled."""
+        queue = session.inference_queue
+        while True:
+            window = await queue.get()
+            session.inference_busy = True
+            try:
+                if window.partial:
+                    await self._process_partial(websocket, session, window)
+                else:
+                    await self._process_audio(websocket, session, window)
+            except Exception as e:
+                logger.error(f"Inference worker error: {e}")
+            finally:
+                session.inference_busy = False
+                queue.task_done()
 
+    def _initial_prompt(self, session: StreamingSession) -> str | None:
+        """Previous transcription to prompt the next window with, if carryover is enabled."""
+        if self.config.use_context_carryover and session.last_transcription:
+            return session.last_transcription
+        return None
+
+    async def _transcribe_chunk(
+        self,
+        audio_data: np.ndarray,
+        config: Mapping[str, Any],
+        initial_prompt: str | None,
+        overlap_seconds: float,
+    ) -> dict:
+        """Transcribe one buffered chunk, in memory unless the handler was given a scratch pool."""
+        kwargs = {
+            "language": config["language"],
+            "initial_prompt": initial_prompt,
+            "task": config.get("task", "transcribe"),
+            "skip_seconds": overlap_seconds,
+        }
+        if self.scratch_pool is None:
+            pcm = to_whisper_pcm(audio_data, self.config.sample_rate)
+            return await self.asr_service.transcribe_streaming(pcm, **kwargs)
+
+        async with self.scratch_pool.acquire() as tmp_path:
+            # Overwrites (truncates) the pooled file left by the previous chunk
+            await asyncio.to_thread(sf.write, tmp_path, audio_data, self.config.sample_rate)
+            return await self.asr_service.transcribe_streaming(tmp_path, **kwargs)
+
+    async def _process_audio(self, websocket: WebSocket, session: StreamingSession, window: QueuedWindow) -> None:
+        """Process one audio window and send results with context carryover.
+
+        Args:
+            websocket: Connection to send results on
+            session: Session whose transcript and context are updated
+            window: Queued window; its samples are owned by the caller
+        """
+        audio_data, config, overlap_seconds = window.audio, window.config, window.overlap_seconds
         try:
-            audio_data = np.concatenate(session.audio_buffer)
             duration = len(audio_data) / self.config.sample_rate
 
-            if duration < 0.3:
+            if duration - overlap_seconds < 0.3:
                 return
 
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as tmp:
-                sf.write(tmp.name, audio_data, self.config.sample_rate)
-                tmp_path = tmp.name
+            if self.config.send_processing:
+                await _send(websocket, {"type": "processing", "duration": duration})
 
-            try:
-                await websocket.send_json({"type": "processing", "duration": duration})
-
-                # Use streaming transcribe with context carryover
-                initial_prompt = None
-                if self.config.use_context_carryover and session.last_transcription:
-                    initial_prompt = session.last_transcription
-
-                result = await self.asr_service.transcribe_streaming(
-                    tmp_path,
-                    language=session.config["language"],
-                    initial_prompt=initial_prompt,
-                    task=session.config.get("task", "transcribe"),
-                )
-
-                # Skip empty results (likely no speech detected)
-                if not result["text"]:
-                    logger.debug("Empty transcription, skipping")
-                    return
-
-                # Update context for next chunk
-                if self.config.use_context_carryover:
-                    session.last_transcription = result.get("last_words", "")
-
-                # Accumulate full session transcript
-                if session.accumulated_text:
-                    session.accumulated_text += " " + result["text"]
-                else:
-                    session.accumulated_text = result["text"]
+            # Use streaming transcribe with context carryover
+            initial_prompt = self._initial_prompt(session)
+            result = await self._transcribe_chunk(audio_data, config, initial_prompt, overlap_seconds)
 
-                braille_table = session.config.get("braille_table", self.braille_service.default_table)
-                braille_text = self.braille_service.translate(result["text"], braille_table)
+            # A segment straddling the overlap boundary can repeat the previous window's last words
+            if result.get("overlap_words") and session.overlap_text:
+                result["text"] = _trim_repeated_words(session.overlap_text, result["text"], result["overlap_words"])
 
-                # Accumulate braille
-                if session.accumulated_braille:
-                    session.accumulated_braille += " " + braille_text
-                else:
-                    session.accumulated_braille = braille_text
-
-                # Debug logging
-                logger.info(f"Transcribed: {result['text'][:50]}")
-                if braille_text:
-                    logger.info(f"Braille (len={len(braille_text)}): {braille_text[:50]}")
-
-                await websocket.send_json({
-                    "type": "result",
-                    "transcribed_text": result["text"],
-                    "braille": braille_text,
-                    "language": result.get("language"),
-                    "table_used": braille_table,
-                    "audio_duration": result.get("duration"),
-                    "success": True,
-                })
+            # Skip empty results (likely no speech detected)
+            if not result["text"]:
+                logger.debug("Empty transcription, skipping")
+                return
 
-            finally:
-                with contextlib.suppress(OSError):
-                    os.unlink(tmp_path)
+            braille_table = config.get("braille_table", self.braille_service.default_table)
+            # Only this window's new text is translated (the session braille is built by appending),
+            # off the event loop so the receive loop keeps buffering
+            braille_text = await asyncio.to_thread(self.braille_service.translate, result["text"], braille_table)
+
+            # A new recording started while this window was being transcribed
+            if window.recording != session.recording_id:
+                logger.debug("Discarding window from a previous recording")
+                return
+
+            # Update context for next chunk
+            session.overlap_text = result.get("last_words", "")
+            if self.config.use_context_carryover:
+                session.last_transcription = result.get("last_words", "")
+
+            # Accumulate full session transcript and braille
+            session.accumulated_text_parts.append(result["text"])
+            session.accumulated_braille_parts.append(braille_text)
+
+            # Debug logging (lazy %-formatting: nothing is built unless DEBUG is enabled)
+            logger.debug("Transcribed: %.50s", result["text"])
+            if braille_text:
+                logger.debug("Braille (len=%d): %.50s", len(braille_text), braille_text)
+
+            await _send(websocket, {
+                "type": "result",
+                "transcribed_text": result["text"],
+                "braille": braille_text,
+                "language": result.get("language"),
+                "table_used": braille_table,
+                "audio_duration": result.get("duration"),
+                "success": True,
+            })
+
+        except Exception as e:
+            await _send(websocket, {"type": "error", "message": str(e)})
+
+    async def _process_partial(self, websocket: WebSocket, session: StreamingSession, window: QueuedWindow) -> None:
+        """Transcribe the window filled so far and send it as a provisional hypothesis.
+
+        The session transcript and context are left untouched; the window's result replaces it.
+        """
+        try:
+            initial_prompt = self._initial_prompt(session)
+            result = await self._transcribe_chunk(window.audio, window.config, initial_prompt, window.overlap_seconds)
+            text = result["text"]
+            if result.get("overlap_words") and session.overlap_text:
+                text = _trim_repeated_words(session.overlap_text, text, result["overlap_words"])
+            if text and window.recording == session.recording_id:
+                await _send(websocket, {"type": "partial", "transcribed_text": text})
 
         except Exception as e:
-            await websocket.send_json({"type": "error", "message": str(e)})
+            await _send(websocket, {"type": "error", "message": str(e)})
 
     def _update_vad_state(self, session: StreamingSession, vad_result: VADResult) -> None:
         """Update VAD state machine based on frame result."""
@@ -325,18 +605,24 @@ class SpeechToBrailleWebSocket:
                     vad_result.speech_end = True
                     state.is_speech_active = False
 
-    def _should_process_audio(self, session: StreamingSession, vad_result: VADResult) -> bool:
+    def _has_speech(self, session: StreamingSession) -> bool:
+        """Check whether the buffered audio holds enough speech to transcribe (always True without VAD)."""
+        if session.vad_stream is None:
+            return True
+        return session.speech_duration >= self.vad_service.config.min_speech_duration_ms / 1000.0
+
+    def _should_process_audio(self, session: StreamingSession, speech_end: bool) -> bool:
         """Determine if ASR should process accumulated audio."""
         # Minimum duration check
-        if session.buffer_duration < self.config.min_duration:
+        if session.buffer_samples < self._min_samples:
             return False
 
         # Force process if buffer limit reached
-        if session.buffer_duration >= self.config.buffer_limit:
+        if session.buffer_samples >= self._limit_samples:
             return True
 
         # Check for speech end with sufficient silence
-        if vad_result.speech_end:
+        if speech_end:
             return True
 
         # Force process if max speech duration exceeded